@@ -15,29 +15,171 @@ Comprehensive flight price analysis tool implementing 7 key strategies:
 import sys
 import json
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
 
-# Add modules to path
-sys.path.insert(0, str(Path(__file__).parent))
+try:
+    import orjson  # Optional fast JSON serializer (see requirements.txt)
+except ImportError:
+    orjson = None
+
+_MODULE_DIR = Path(__file__).resolve().parent
 
-from modules.utils import FlightLogger, DateHelper, AirportHelper
-from modules.search import FlightSearchEngine, rank_legal_options
-from modules.geo_pricing import GeoPricingAnalyzer, compare_markets_for_route
-from modules.inflation import PriceInflationAnalyzer, create_search_plan
-from modules.historical import HistoricalPricingAnalyzer
-from modules.fare_tracking import FareTrackingStrategy, monitor_price_stability
-from modules.platform_compare import PlatformComparator, quick_platform_comparison
+# Add modules to path
+sys.path.insert(0, str(_MODULE_DIR))
+
+
+def _load_modules():
+    """
+    Import the strategy modules on first use.
+
+    Deferring these keeps `--help` and argument errors fast - they exit
+    before any strategy module is parsed or imported.
+    """
+    if 'PlatformComparator' in globals():
+        return
+
+    global FlightLogger, DateHelper, AirportHelper
+    global FlightSearchEngine, rank_legal_options
+    global GeoPricingAnalyzer, compare_markets_for_route
+    global PriceInflationAnalyzer, create_search_plan
+    global HistoricalPricingAnalyzer
+    global FareTrackingStrategy, monitor_price_stability
+    global PlatformComparator, quick_platform_comparison
+
+    from modules.utils import FlightLogger, DateHelper, AirportHelper
+    from modules.search import FlightSearchEngine, rank_legal_options
+    from modules.geo_pricing import GeoPricingAnalyzer, compare_markets_for_route
+    from modules.inflation import PriceInflationAnalyzer, create_search_plan
+    from modules.historical import HistoricalPricingAnalyzer
+    from modules.fare_tracking import FareTrackingStrategy, monitor_price_stability
+    from modules.platform_compare import PlatformComparator, quick_platform_comparison
+
+
+_RULE = '=' * 80
+
+# Modules that are enabled by default when absent from config
+_KNOWN_MODULES = (
+    'search', 'inflation', 'geo_pricing',
+    'historical', 'platform_compare', 'fare_tracking'
+)
+
+# Static fare rules knowledge base - built once at import time instead of
+# per analysis call.
+_FARE_RULES: Dict[str, Any] = {
+    'ticket_classes': {
+        'economy_basic': {
+            'description': 'Cheapest option, most restrictions',
+            'typical_features': ['No changes', 'No refunds', 'Last to board', 'No seat selection'],
+            'cost_savings': '20-30% vs standard economy',
+            'recommendation': 'Good for certain travel, no flexibility needed'
+        },
+        'economy_standard': {
+            'description': 'Standard economy with moderate flexibility',
+            'typical_features': ['Paid changes allowed', 'Seat selection', 'Standard baggage'],
+            'cost_savings': 'Baseline',
+            'recommendation': 'Best balance of price and flexibility'
+        },
+        'economy_flex': {
+            'description': 'Flexible economy ticket',
+            'typical_features': ['Free changes', 'Refundable (with fee)', 'Priority boarding'],
+            'cost_increase': '30-50% vs standard',
+            'recommendation': 'Only if high chance of changes needed'
+        },
+        'premium_economy': {
+            'description': 'Enhanced comfort, moderate price increase',
+            'typical_features': ['More legroom', 'Better meals', 'Priority boarding', 'More baggage'],
+            'cost_increase': '50-100% vs economy',
+            'recommendation': 'Consider for long-haul (8+ hours)'
+        }
+    },
+    'routing_logic': {
+        'direct_flights': 'Most expensive but most convenient',
+        'one_stop': '15-30% cheaper, reasonable for medium distances',
+        'two_stops': '30-50% cheaper, only worthwhile for large savings',
+        'self_transfer': 'Cheapest but highest risk, no protection'
+    },
+    'pricing_conditions': {
+        'advance_purchase': 'Book 21-90 days ahead for best economy prices',
+        'saturday_night_stay': 'Often required for cheap fares (legacy rule)',
+        'minimum_stay': 'Some fares require 2-7 night minimum',
+        'maximum_stay': 'Typically 1-12 months from departure'
+    },
+    'cost_reduction_tips': [
+        'Choose basic economy if no baggage needed',
+        'Bring own food to avoid inflated onboard prices',
+        'Select free seats (usually middle seats)',
+        'Join loyalty program even for one flight (better support)',
+        'Book separate one-way tickets if cheaper than round-trip',
+        'Consider nearby airports (may save 30%+)',
+        'Fly Tuesday/Wednesday instead of Friday/Sunday (10-20% cheaper)',
+        'Book on Tuesday afternoon for weekly low prices'
+    ]
+}
+
+
+# Recommendation templates, kept together so the wording can be tuned
+# (or localized) without touching assembly logic
+_REC_CHEAPEST = "💰 CHEAPEST OPTION: {route_type} route at €{price:.2f}"
+_REC_GEO = "🌍 GEO-PRICING: Save €{savings:.2f} by booking from {country}"
+_REC_TIMING_OPTIMAL = "✅ TIMING: You're in the optimal booking window - good time to book!"
+_REC_TIMING = "⏰ TIMING: {timing}"
+_REC_INFLATION = (
+    "🛡️  IMPORTANT: Use incognito mode, clear cookies, and limit searches to avoid price inflation"
+)
+_REC_PLATFORM = "💻 PLATFORM: Book via {platform} for lowest total cost"
+_REC_TRACKING = (
+    "🔔 TRACKING: Set up Google Flights & Kayak price alerts instead of manual searching"
+)
+
+_MISSING = object()
+
+
+def _dig(d: Any, *keys: str, default: Any = None) -> Any:
+    """Walk nested dicts, returning default as soon as a key is missing."""
+    for key in keys:
+        if not isinstance(d, dict):
+            return default
+        d = d.get(key, _MISSING)
+        if d is _MISSING:
+            return default
+    return d
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config(config_file: str) -> Dict[str, Any]:
+    """Read and parse a config file, memoized by path."""
+    with open(config_file, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class FlightPriceAnalyzer:
     """Main application class coordinating all analysis modules."""
 
+    __slots__ = (
+        'logger', 'config', '_enabled',
+        'search_engine', 'geo_analyzer', 'inflation_analyzer',
+        'historical_analyzer', 'tracking_strategy', 'platform_comparator'
+    )
+
     def __init__(self, config_path: str = 'config.json'):
+        _load_modules()
         self.logger = FlightLogger("Main")
         self.config = self._load_config(config_path)
 
+        # Resolve module gates once instead of chained .get() per analysis
+        mods = self.config.get('modules', {})
+        self._enabled = frozenset(
+            name for name in set(_KNOWN_MODULES) | set(mods)
+            if mods.get(name, {}).get('enabled', True)
+        )
+
         # Initialize all modules
         self.search_engine = FlightSearchEngine(self.logger)
         self.geo_analyzer = GeoPricingAnalyzer(self.logger)
@@ -48,14 +190,25 @@ class FlightPriceAnalyzer:
 
         self.logger.info("Flight Price Analyzer initialized")
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def shared(cls, config_path: str = 'config.json') -> 'FlightPriceAnalyzer':
+        """
+        Return a process-wide analyzer for the given config path.
+
+        All module state is read-only after __init__, so one instance can
+        safely serve many comprehensive_analysis calls; reusing it removes
+        module construction from the per-request path.
+        """
+        return cls(config_path=config_path)
+
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from JSON file."""
         try:
-            config_file = Path(__file__).parent / config_path
-            with open(config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            config_file = _MODULE_DIR / config_path
+            return _read_config(str(config_file))
         except FileNotFoundError:
-            self.logger.warning(f"Config file {config_path} not found, using defaults")
+            self.logger.warning("Config file %s not found, using defaults", config_path)
             return {}
 
     def comprehensive_analysis(
@@ -76,18 +229,19 @@ class FlightPriceAnalyzer:
             return_date: Optional return date
             target_price: Optional target price in EUR
         """
-        self.logger.info(f"\n{'='*80}")
-        self.logger.info(f"COMPREHENSIVE FLIGHT PRICE ANALYSIS")
-        self.logger.info(f"{'='*80}")
-        self.logger.info(f"Route: {origin} → {destination}")
-        self.logger.info(f"Departure: {departure_date}")
+        self.logger.info("\n" + _RULE)
+        self.logger.info("COMPREHENSIVE FLIGHT PRICE ANALYSIS")
+        self.logger.info(_RULE)
+        self.logger.info("Route: %s → %s", origin, destination)
+        self.logger.info("Departure: %s", departure_date)
         if return_date:
-            self.logger.info(f"Return: {return_date}")
-        self.logger.info(f"{'='*80}\n")
+            self.logger.info("Return: %s", return_date)
+        self.logger.info(_RULE + "\n")
 
-        # Parse dates
+        # Parse dates and freeze a single "now" snapshot for the whole run
         dep_date = DateHelper.parse_date(departure_date)
         ret_date = DateHelper.parse_date(return_date) if return_date else None
+        days_until = (dep_date - datetime.now()).days
 
         results = {
             'route_info': {
@@ -100,7 +254,9 @@ class FlightPriceAnalyzer:
         }
 
         # Strategy 1: Advanced Search (Hidden City, Nearby Airports, Multi-leg)
-        if self.config.get('modules', {}).get('search', {}).get('enabled', True):
+        # Runs first because its direct-flight price is the baseline for
+        # geo-pricing and platform comparison.
+        if 'search' in self._enabled:
             self.logger.info("📍 [1/7] Analyzing Hidden City Tickets & Alternative Routing...")
             results['advanced_search'] = self.search_engine.comprehensive_search(
                 origin, destination, dep_date, ret_date
@@ -109,10 +265,17 @@ class FlightPriceAnalyzer:
                 self.search_engine.search_direct_flight(origin, destination, dep_date, ret_date)
             ])
 
-        # Strategy 2: Anti-Price-Inflation
-        if self.config.get('modules', {}).get('inflation', {}).get('enabled', True):
+        # Baseline price shared by geo-pricing and platform comparison
+        direct = results.get('advanced_search', {}).get('direct_flight') or {}
+        base_price = direct.get('price', 450.0)
+
+        # Strategies 2-7 are independent of each other, so run them
+        # concurrently and collapse wall time to the slowest strategy.
+        tasks: Dict[str, Callable[[], Any]] = {}
+
+        if 'inflation' in self._enabled:
             self.logger.info("🛡️  [2/7] Analyzing Price Inflation Triggers & Avoidance...")
-            results['price_inflation'] = {
+            tasks['price_inflation'] = lambda: {
                 'tracking_methods': self.inflation_analyzer.analyze_tracking_methods(),
                 'triggers': self.inflation_analyzer.explain_price_inflation_triggers(),
                 'avoidance_strategy': self.inflation_analyzer.get_avoidance_strategy(),
@@ -121,107 +284,74 @@ class FlightPriceAnalyzer:
                 )
             }
 
-        # Strategy 3: Geo-Pricing Simulation
-        if self.config.get('modules', {}).get('geo_pricing', {}).get('enabled', True):
+        if 'geo_pricing' in self._enabled:
             self.logger.info("🌍 [3/7] Simulating Geo-Pricing Across Countries...")
-            base_price = results.get('advanced_search', {}).get('direct_flight', {}).get('price', 450.0)
-            results['geo_pricing'] = self.geo_analyzer.find_cheapest_market(
-                base_price, 'EUR', origin, destination, dep_date
-            )
-            results['geo_pricing']['access_methods'] = self.geo_analyzer.legal_access_methods(
-                results['geo_pricing']['cheapest_market']['country']
+            tasks['geo_pricing'] = lambda: self._analyze_geo_pricing(
+                base_price, origin, destination, dep_date
             )
 
-        # Strategy 4: Historical Pricing Analysis
-        if self.config.get('modules', {}).get('historical', {}).get('enabled', True):
+        if 'historical' in self._enabled:
             self.logger.info("📊 [4/7] Analyzing Historical Pricing Patterns...")
-            results['historical_analysis'] = self.historical_analyzer.get_comprehensive_analysis(
+            tasks['historical_analysis'] = lambda: self.historical_analyzer.get_comprehensive_analysis(
                 origin, destination, dep_date, ret_date
             )
 
-        # Strategy 5: Fare Rules Analysis (integrated in search results)
         self.logger.info("📋 [5/7] Analyzing Fare Rules & Ticket Classes...")
-        results['fare_rules'] = self._analyze_fare_rules()
+        tasks['fare_rules'] = self._analyze_fare_rules
 
-        # Strategy 6: Platform Comparison
-        if self.config.get('modules', {}).get('platform_compare', {}).get('enabled', True):
+        if 'platform_compare' in self._enabled:
             self.logger.info("💰 [6/7] Comparing Booking Platforms...")
-            base_price = results.get('advanced_search', {}).get('direct_flight', {}).get('price', 450.0)
-            results['platform_comparison'] = self.platform_comparator.compare_platforms(
+            tasks['platform_comparison'] = lambda: self.platform_comparator.compare_platforms(
                 base_price, origin, destination
             )
 
-        # Strategy 7: Fare Tracking Strategy
-        if self.config.get('modules', {}).get('fare_tracking', {}).get('enabled', True):
+        if 'fare_tracking' in self._enabled:
             self.logger.info("🔔 [7/7] Creating Fare Tracking Strategy...")
-            results['tracking_strategy'] = self.tracking_strategy.create_tracking_strategy(
+            tasks['tracking_strategy'] = lambda: self.tracking_strategy.create_tracking_strategy(
                 origin, destination, dep_date, ret_date, target_price
             )
-            results['tracking_example'] = self.tracking_strategy.get_practical_example(
-                origin, destination, (dep_date - datetime.now()).days
+            tasks['tracking_example'] = lambda: self.tracking_strategy.get_practical_example(
+                origin, destination, days_until
             )
 
+        completed = {}
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = {executor.submit(task): key for key, task in tasks.items()}
+            for future in as_completed(futures):
+                completed[futures[future]] = future.result()
+
+        # Assemble in strategy order regardless of completion order
+        for key in tasks:
+            results[key] = completed[key]
+
         # Generate final recommendations
         results['final_recommendations'] = self._generate_final_recommendations(results)
 
-        self.logger.info(f"\n{'='*80}")
+        self.logger.info("\n" + _RULE)
         self.logger.info("ANALYSIS COMPLETE")
-        self.logger.info(f"{'='*80}\n")
+        self.logger.info(_RULE + "\n")
 
         return results
 
+    def _analyze_geo_pricing(
+        self,
+        base_price: float,
+        origin: str,
+        destination: str,
+        dep_date: datetime
+    ) -> Dict[str, Any]:
+        """Run geo-pricing analysis including access methods for the cheapest market."""
+        geo = self.geo_analyzer.find_cheapest_market(
+            base_price, 'EUR', origin, destination, dep_date
+        )
+        geo['access_methods'] = self.geo_analyzer.legal_access_methods(
+            geo['cheapest_market']['country']
+        )
+        return geo
+
     def _analyze_fare_rules(self) -> Dict[str, Any]:
         """Analyze fare rules and ticket classes."""
-        return {
-            'ticket_classes': {
-                'economy_basic': {
-                    'description': 'Cheapest option, most restrictions',
-                    'typical_features': ['No changes', 'No refunds', 'Last to board', 'No seat selection'],
-                    'cost_savings': '20-30% vs standard economy',
-                    'recommendation': 'Good for certain travel, no flexibility needed'
-                },
-                'economy_standard': {
-                    'description': 'Standard economy with moderate flexibility',
-                    'typical_features': ['Paid changes allowed', 'Seat selection', 'Standard baggage'],
-                    'cost_savings': 'Baseline',
-                    'recommendation': 'Best balance of price and flexibility'
-                },
-                'economy_flex': {
-                    'description': 'Flexible economy ticket',
-                    'typical_features': ['Free changes', 'Refundable (with fee)', 'Priority boarding'],
-                    'cost_increase': '30-50% vs standard',
-                    'recommendation': 'Only if high chance of changes needed'
-                },
-                'premium_economy': {
-                    'description': 'Enhanced comfort, moderate price increase',
-                    'typical_features': ['More legroom', 'Better meals', 'Priority boarding', 'More baggage'],
-                    'cost_increase': '50-100% vs economy',
-                    'recommendation': 'Consider for long-haul (8+ hours)'
-                }
-            },
-            'routing_logic': {
-                'direct_flights': 'Most expensive but most convenient',
-                'one_stop': '15-30% cheaper, reasonable for medium distances',
-                'two_stops': '30-50% cheaper, only worthwhile for large savings',
-                'self_transfer': 'Cheapest but highest risk, no protection'
-            },
-            'pricing_conditions': {
-                'advance_purchase': 'Book 21-90 days ahead for best economy prices',
-                'saturday_night_stay': 'Often required for cheap fares (legacy rule)',
-                'minimum_stay': 'Some fares require 2-7 night minimum',
-                'maximum_stay': 'Typically 1-12 months from departure'
-            },
-            'cost_reduction_tips': [
-                'Choose basic economy if no baggage needed',
-                'Bring own food to avoid inflated onboard prices',
-                'Select free seats (usually middle seats)',
-                'Join loyalty program even for one flight (better support)',
-                'Book separate one-way tickets if cheaper than round-trip',
-                'Consider nearby airports (may save 30%+)',
-                'Fly Tuesday/Wednesday instead of Friday/Sunday (10-20% cheaper)',
-                'Book on Tuesday afternoon for weekly low prices'
-            ]
-        }
+        return _FARE_RULES
 
     def _generate_final_recommendations(self, results: Dict[str, Any]) -> List[str]:
         """Generate prioritized final recommendations."""
@@ -229,101 +359,158 @@ class FlightPriceAnalyzer:
 
         # Top cheapest option
         if 'advanced_search' in results:
-            cheapest = results['advanced_search'].get('cheapest_option', {})
-            recommendations.append(
-                f"💰 CHEAPEST OPTION: {cheapest.get('route_type', 'Unknown')} route at "
-                f"€{cheapest.get('price', 0):.2f}"
-            )
+            recommendations.append(_REC_CHEAPEST.format(
+                route_type=_dig(results, 'advanced_search', 'cheapest_option', 'route_type', default='Unknown'),
+                price=_dig(results, 'advanced_search', 'cheapest_option', 'price', default=0)
+            ))
 
         # Geo-pricing opportunity
         if 'geo_pricing' in results:
-            geo = results['geo_pricing']
-            if geo.get('max_savings', 0) > 30:
-                recommendations.append(
-                    f"🌍 GEO-PRICING: Save €{geo['max_savings']:.2f} by booking from "
-                    f"{geo['cheapest_market']['country_name']}"
-                )
+            max_savings = _dig(results, 'geo_pricing', 'max_savings', default=0)
+            if max_savings > 30:
+                recommendations.append(_REC_GEO.format(
+                    savings=max_savings,
+                    country=_dig(results, 'geo_pricing', 'cheapest_market', 'country_name', default='N/A')
+                ))
 
         # Booking window
         if 'historical_analysis' in results:
-            hist = results['historical_analysis'].get('booking_window_analysis', {})
-            if hist.get('currently_optimal'):
-                recommendations.append("✅ TIMING: You're in the optimal booking window - good time to book!")
+            if _dig(results, 'historical_analysis', 'booking_window_analysis', 'currently_optimal'):
+                recommendations.append(_REC_TIMING_OPTIMAL)
             else:
-                recommendations.append(f"⏰ TIMING: {hist.get('recommendation', '')}")
+                recommendations.append(_REC_TIMING.format(
+                    timing=_dig(results, 'historical_analysis', 'booking_window_analysis', 'recommendation', default='')
+                ))
 
         # Price inflation warning
-        recommendations.append(
-            "🛡️  IMPORTANT: Use incognito mode, clear cookies, and limit searches to avoid price inflation"
-        )
+        recommendations.append(_REC_INFLATION)
 
         # Platform recommendation
         if 'platform_comparison' in results:
-            platform = results['platform_comparison'].get('cheapest_overall', {})
-            recommendations.append(
-                f"💻 PLATFORM: Book via {platform.get('platform', 'N/A')} for lowest total cost"
-            )
+            recommendations.append(_REC_PLATFORM.format(
+                platform=_dig(results, 'platform_comparison', 'cheapest_overall', 'platform', default='N/A')
+            ))
 
         # Tracking strategy
-        recommendations.append(
-            "🔔 TRACKING: Set up Google Flights & Kayak price alerts instead of manual searching"
-        )
+        recommendations.append(_REC_TRACKING)
 
         return recommendations
 
     def export_results(self, results: Dict[str, Any], format: str = 'json', filename: str = 'analysis_results'):
         """Export results to file."""
-        output_path = Path(__file__).parent / f"{filename}.{format}"
+        output_path = _MODULE_DIR / f"{filename}.{format}"
 
         try:
             if format == 'json':
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+                if orjson is not None:
+                    # orjson serializes to a single bytes buffer, much faster
+                    # than stdlib pretty-printing for large nested results
+                    output_path.write_bytes(orjson.dumps(
+                        results, default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    ))
+                else:
+                    with open(output_path, 'w', encoding='utf-8') as f:
+                        json.dump(results, f, indent=2, ensure_ascii=False, default=str)
             else:
-                self.logger.error(f"Unsupported format: {format}")
+                self.logger.error("Unsupported format: %s", format)
                 return
 
-            self.logger.info(f"Results exported to {output_path}")
+            self.logger.info("Results exported to %s", output_path)
         except Exception as e:
-            self.logger.error(f"Export failed: {e}")
+            self.logger.error("Export failed: %s", e)
 
     def print_summary(self, results: Dict[str, Any]):
         """Print human-readable summary."""
-        print("\n" + "="*80)
-        print("FLIGHT PRICE ANALYSIS SUMMARY")
-        print("="*80)
+        # Build the whole summary in memory and emit it with a single
+        # write instead of ~20 individual print() calls.
+        lines = []
+
+        lines.append("\n" + _RULE)
+        lines.append("FLIGHT PRICE ANALYSIS SUMMARY")
+        lines.append(_RULE)
 
         # Route info
         route = results.get('route_info', {})
-        print(f"\nRoute: {route.get('route_description', 'N/A')}")
-        print(f"Departure: {route.get('departure_date', 'N/A')}")
+        lines.append(f"\nRoute: {route.get('route_description', 'N/A')}")
+        lines.append(f"Departure: {route.get('departure_date', 'N/A')}")
         if route.get('return_date'):
-            print(f"Return: {route.get('return_date')}")
+            lines.append(f"Return: {route.get('return_date')}")
 
         # Recommendations
-        print("\n" + "-"*80)
-        print("KEY RECOMMENDATIONS:")
-        print("-"*80)
+        lines.append("\n" + "-"*80)
+        lines.append("KEY RECOMMENDATIONS:")
+        lines.append("-"*80)
         for i, rec in enumerate(results.get('final_recommendations', []), 1):
-            print(f"{i}. {rec}")
+            lines.append(f"{i}. {rec}")
 
         # Price summary
         if 'advanced_search' in results:
-            print("\n" + "-"*80)
-            print("PRICE SUMMARY:")
-            print("-"*80)
+            lines.append("\n" + "-"*80)
+            lines.append("PRICE SUMMARY:")
+            lines.append("-"*80)
             direct = results['advanced_search'].get('direct_flight', {})
             cheapest = results['advanced_search'].get('cheapest_option', {})
 
-            print(f"Direct Flight: €{direct.get('price', 0):.2f}")
-            print(f"Cheapest Option: €{cheapest.get('price', 0):.2f} ({cheapest.get('route_type', 'N/A')})")
+            lines.append(f"Direct Flight: €{direct.get('price', 0):.2f}")
+            lines.append(f"Cheapest Option: €{cheapest.get('price', 0):.2f} ({cheapest.get('route_type', 'N/A')})")
 
             if 'price_analysis' in results['advanced_search']:
                 analysis = results['advanced_search']['price_analysis']
-                print(f"Potential Savings: €{analysis.get('savings_amount', 0):.2f} "
-                      f"({analysis.get('savings_percentage', 0):.1f}%)")
+                lines.append(f"Potential Savings: €{analysis.get('savings_amount', 0):.2f} "
+                             f"({analysis.get('savings_percentage', 0):.1f}%)")
+
+        lines.append("\n" + _RULE + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _read_routes_file(path: str) -> List[Dict[str, Any]]:
+    """
+    Read a routes CSV with rows of
+    origin,destination,departure_date[,return_date[,target_price]].
+
+    Blank lines and lines starting with '#' are skipped.
+    """
+    import csv
+
+    routes = []
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            if not row or row[0].lstrip().startswith('#'):
+                continue
+            entry: Dict[str, Any] = {
+                'origin': AirportHelper.normalize(row[0]),
+                'destination': AirportHelper.normalize(row[1]),
+                'departure_date': row[2].strip()
+            }
+            if len(row) > 3 and row[3].strip():
+                entry['return_date'] = row[3].strip()
+            if len(row) > 4 and row[4].strip():
+                entry['target_price'] = float(row[4])
+            routes.append(entry)
+    return routes
+
 
-        print("\n" + "="*80 + "\n")
+def _run_batch(analyzer: 'FlightPriceAnalyzer', routes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Analyze many routes concurrently on one analyzer instance.
+
+    Amortizes interpreter startup, imports, and config parsing across the
+    whole batch; concurrency is bounded by the core count.
+    """
+    import asyncio
+    import os
+
+    async def gather_all():
+        semaphore = asyncio.Semaphore(os.cpu_count() or 8)
+
+        async def run_one(route):
+            async with semaphore:
+                return await asyncio.to_thread(analyzer.comprehensive_analysis, **route)
+
+        return await asyncio.gather(*(run_one(route) for route in routes))
+
+    return asyncio.run(gather_all())
 
 
 def main():
@@ -332,24 +519,61 @@ def main():
         description='Flight Price Analyzer - Find the cheapest flights using advanced strategies'
     )
 
-    parser.add_argument('origin', help='Origin airport code (e.g., FRA)')
-    parser.add_argument('destination', help='Destination airport code (e.g., JFK)')
-    parser.add_argument('departure_date', help='Departure date (YYYY-MM-DD)')
+    parser.add_argument('origin', nargs='?', help='Origin airport code (e.g., FRA)')
+    parser.add_argument('destination', nargs='?', help='Destination airport code (e.g., JFK)')
+    parser.add_argument('departure_date', nargs='?', help='Departure date (YYYY-MM-DD)')
     parser.add_argument('--return-date', '-r', help='Return date (YYYY-MM-DD)')
     parser.add_argument('--target-price', '-t', type=float, help='Target price in EUR')
     parser.add_argument('--output', '-o', default='json', choices=['json'], help='Output format')
     parser.add_argument('--export', '-e', help='Export results to file (without extension)')
     parser.add_argument('--config', '-c', default='config.json', help='Config file path')
+    parser.add_argument('--routes-file', '-f',
+                        help='CSV file of routes to analyze in one batch '
+                             '(origin,destination,departure_date[,return_date[,target_price]])')
 
     args = parser.parse_args()
 
+    _load_modules()
+
+    # Batch mode: analyze every route in the file with one analyzer
+    if args.routes_file:
+        try:
+            routes = _read_routes_file(args.routes_file)
+        except (OSError, ValueError, IndexError) as e:
+            parser.error(f"Cannot read routes file {args.routes_file}: {e}")
+        if not routes:
+            parser.error(f"No routes found in {args.routes_file}")
+
+        analyzer = FlightPriceAnalyzer.shared(config_path=args.config)
+        all_results = _run_batch(analyzer, routes)
+
+        base_name = args.export or 'analysis_results'
+        for i, (route, results) in enumerate(zip(routes, all_results), 1):
+            analyzer.print_summary(results)
+            analyzer.export_results(
+                results, format=args.output,
+                filename=f"{base_name}_{route['origin']}_{route['destination']}_{i}"
+            )
+        return
+
+    if not (args.origin and args.destination and args.departure_date):
+        parser.error('origin, destination and departure_date are required '
+                     'unless --routes-file is given')
+
+    # Normalize and validate airport codes once, before heavy module init
+    try:
+        origin = AirportHelper.normalize(args.origin)
+        destination = AirportHelper.normalize(args.destination)
+    except ValueError as e:
+        parser.error(str(e))
+
     # Create analyzer
-    analyzer = FlightPriceAnalyzer(config_path=args.config)
+    analyzer = FlightPriceAnalyzer.shared(config_path=args.config)
 
     # Run analysis
     results = analyzer.comprehensive_analysis(
-        origin=args.origin.upper(),
-        destination=args.destination.upper(),
+        origin=origin,
+        destination=destination,
         departure_date=args.departure_date,
         return_date=args.return_date,
         target_price=args.target_price
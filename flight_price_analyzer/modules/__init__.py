@@ -2,13 +2,7 @@
 Flight Price Analyzer Modules
 """
 
-from .utils import *
-from .search import *
-from .geo_pricing import *
-from .inflation import *
-from .historical import *
-from .fare_tracking import *
-from .platform_compare import *
+import importlib
 
 __all__ = [
     'FlightLogger',
@@ -23,3 +17,32 @@ __all__ = [
     'FareTrackingStrategy',
     'PlatformComparator'
 ]
+
+# Lazy import registry (PEP 562): submodules are only imported when one of
+# their symbols is first accessed, so importing the package stays cheap.
+_LAZY = {
+    'FlightLogger': 'utils',
+    'CurrencyConverter': 'utils',
+    'AirportHelper': 'utils',
+    'DateHelper': 'utils',
+    'RequestHelper': 'utils',
+    'FlightSearchEngine': 'search',
+    'GeoPricingAnalyzer': 'geo_pricing',
+    'PriceInflationAnalyzer': 'inflation',
+    'HistoricalPricingAnalyzer': 'historical',
+    'FareTrackingStrategy': 'fare_tracking',
+    'PlatformComparator': 'platform_compare',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(f'.{_LAZY[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,8 +5,170 @@ Analyzes how flight prices vary across different countries, currencies, and regi
 
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+import functools
+import operator
 from .utils import FlightLogger, CurrencyConverter
 
+# CurrencyConverter is stateless (all classmethods over class-level rates), so
+# one shared instance serves every analyzer.
+_CONVERTER = CurrencyConverter()
+
+# Static tables for legal_access_methods; none of this depends on the target
+# country, so it is built once at import time.
+_LEGAL_METHODS = [
+    {
+        'method': 'VPN Service',
+        'legality': 'Gray Area',
+        'description': 'Use VPN to appear to browse from target country',
+        'risks': [
+            'May violate airline Terms of Service',
+            'Booking might be cancelled if detected',
+            'Payment card address might not match'
+        ],
+        'tips': [
+            'Clear cookies before connecting to VPN',
+            'Use incognito/private browsing',
+            'Consider using local payment method if possible'
+        ]
+    },
+    {
+        'method': 'Local Travel Agency',
+        'legality': 'Fully Legal',
+        'description': 'Contact travel agency in target country to book',
+        'risks': ['Service fees may offset savings'],
+        'tips': [
+            'Find agencies that serve international clients',
+            'Ask for quote before committing',
+            'Ensure they provide proper documentation'
+        ]
+    },
+    {
+        'method': 'Local Credit Card',
+        'legality': 'Fully Legal',
+        'description': 'Use credit card issued in target country',
+        'risks': ['Need to have legitimate card from that country'],
+        'tips': [
+            'Some international banks issue cards in multiple countries',
+            'Transferwise/Revolut cards may help'
+        ]
+    },
+    {
+        'method': 'Book While Physically Present',
+        'legality': 'Fully Legal',
+        'description': 'Book while actually in the target country',
+        'risks': ['Need to travel there first'],
+        'tips': [
+            'Good for future bookings if you visit frequently',
+            'Use local SIM card for extra authenticity'
+        ]
+    },
+    {
+        'method': 'Multi-Currency Booking Sites',
+        'legality': 'Fully Legal',
+        'description': 'Use OTAs that allow currency/region selection',
+        'risks': ['Limited options, may have fees'],
+        'tips': [
+            'Compare prices in different currencies',
+            'Check if card charges foreign transaction fees'
+        ]
+    }
+]
+
+# Country-independent pricing factors appended to every explain_geo_pricing
+# result.
+_GENERAL_FACTORS = (
+    {
+        'factor': 'Local Competition',
+        'impact': 'High',
+        'explanation': 'Markets with more competition (like Poland, Spain) often have lower prices.'
+    },
+    {
+        'factor': 'Purchasing Power',
+        'impact': 'Medium',
+        'explanation': 'Airlines adjust prices based on average income levels in each country.'
+    },
+    {
+        'factor': 'Local Taxes & Fees',
+        'impact': 'Medium',
+        'explanation': 'Different countries have different aviation taxes and airport fees.'
+    },
+    {
+        'factor': 'Point of Sale Rules',
+        'impact': 'Medium',
+        'explanation': 'Airlines segment markets and apply different pricing rules per region.'
+    }
+)
+
+_LEGAL_WARNINGS = [
+    'Always read airline Terms of Service',
+    'Misrepresenting your location may lead to booking cancellation',
+    'Ensure payment card billing address matches',
+    'Some countries have laws against VPN usage',
+    'Consider tax implications of international bookings'
+]
+
+
+def _build_market_table(multipliers, currency_adjustments, country_currencies):
+    """Precompute per-market rows: (country, multiplier, currency, net multiplier)."""
+    table = []
+    for country, multiplier in multipliers.items():
+        currency = country_currencies.get(country, 'EUR')
+        net = multiplier * currency_adjustments.get(currency, 1.0)
+        table.append((country, multiplier, currency, net))
+    return tuple(table)
+
+
+@functools.lru_cache(maxsize=8)
+def _market_rates(base_currency: str):
+    """
+    Market rows with fully folded pricing factors for a base currency.
+
+    convert() is linear in the amount and the regional/currency multipliers
+    are constant, so everything folds into two factors per market:
+    price_local = base_price * local_factor and price_eur = base_price *
+    eur_factor.
+    """
+    base_to_eur = CurrencyConverter.convert(1.0, base_currency, 'EUR')
+    rows = []
+    for country, multiplier, currency, net in GeoPricingAnalyzer._MARKET_TABLE:
+        base_to_local = CurrencyConverter.convert(1.0, base_currency, currency)
+        # Currency symbol prefix, resolved once per market; format_price
+        # renders "<symbol><amount:.2f>", so stripping the "0.00" of a zero
+        # amount leaves the prefix.
+        prefix = CurrencyConverter.format_price(0.0, currency)[:-4]
+        rows.append((country, multiplier, currency, net * base_to_local, net * base_to_eur, prefix))
+    return tuple(rows)
+
+
+@functools.lru_cache(maxsize=256)
+def _compute_regional(base_price: float, base_currency: str):
+    """
+    Numeric pricing rows for all markets, memoized per (price, currency).
+
+    Returns a tuple of (country, multiplier, currency, price_local, price_eur,
+    savings, savings_pct, price_formatted) tuples sorted by EUR price; the
+    dict materialization stays in simulate_regional_pricing so cached rows
+    are never shared mutably between callers.
+    """
+    rows = []
+    for country, multiplier, local_currency, local_factor, eur_factor, prefix in _market_rates(base_currency):
+        price_in_local = base_price * local_factor
+        price_in_eur = base_price * eur_factor
+        rows.append((
+            country,
+            multiplier,
+            local_currency,
+            round(price_in_local, 2),
+            round(price_in_eur, 2),
+            round(base_price - price_in_eur, 2),
+            round((base_price - price_in_eur) / base_price * 100, 2),
+            f"{prefix}{price_in_local:.2f}"
+        ))
+    # Sort once here on the tuples (C-level itemgetter) so no caller needs a
+    # per-dict lambda sort.
+    rows.sort(key=operator.itemgetter(4))
+    return tuple(rows)
+
 
 class GeoPricingAnalyzer:
     """
@@ -56,9 +218,37 @@ class GeoPricingAnalyzer:
         'AUD': 1.00,
     }
 
+    # Country display names
+    _COUNTRY_NAMES = {
+        'DE': 'Germany', 'FR': 'France', 'GB': 'United Kingdom',
+        'US': 'United States', 'CH': 'Switzerland', 'ES': 'Spain',
+        'IT': 'Italy', 'NL': 'Netherlands', 'PL': 'Poland',
+        'TR': 'Turkey', 'IN': 'India', 'TH': 'Thailand',
+        'AE': 'UAE', 'SG': 'Singapore', 'AU': 'Australia',
+        'BR': 'Brazil', 'MX': 'Mexico', 'AR': 'Argentina'
+    }
+
+    # Countries where geo-pricing differences are significant enough that a
+    # VPN would help access the market
+    _VPN_COUNTRIES = frozenset(['PL', 'TR', 'IN', 'TH', 'AR', 'MX', 'BR'])
+
+    # Primary booking currency per country
+    _COUNTRY_CURRENCIES = {
+        'DE': 'EUR', 'FR': 'EUR', 'IT': 'EUR', 'ES': 'EUR', 'NL': 'EUR',
+        'GB': 'GBP', 'US': 'USD', 'CH': 'CHF', 'PL': 'PLN', 'TR': 'TRY',
+        'IN': 'INR', 'TH': 'THB', 'AE': 'AED', 'SG': 'USD', 'AU': 'AUD',
+        'BR': 'USD', 'MX': 'USD', 'AR': 'USD'
+    }
+
+    # Static per-market rows derived once at import time so the pricing
+    # loop is a single multiply per market instead of repeated dict lookups
+    _MARKET_TABLE = _build_market_table(
+        REGIONAL_MULTIPLIERS, CURRENCY_ADJUSTMENTS, _COUNTRY_CURRENCIES
+    )
+
     def __init__(self, logger: Optional[FlightLogger] = None):
         self.logger = logger or FlightLogger("GeoPricing")
-        self.currency_converter = CurrencyConverter()
+        self.currency_converter = _CONVERTER
 
     def simulate_regional_pricing(
         self,
@@ -77,47 +267,48 @@ class GeoPricingAnalyzer:
 
         regional_prices = []
 
-        for country, multiplier in self.REGIONAL_MULTIPLIERS.items():
-            # Apply regional multiplier
-            regional_price = base_price * multiplier
-
-            # Apply currency-specific adjustment
-            local_currency = self._get_country_currency(country)
-            currency_adj = self.CURRENCY_ADJUSTMENTS.get(local_currency, 1.0)
-            regional_price *= currency_adj
-
-            # Convert to local currency
-            price_in_local = self.currency_converter.convert(
-                regional_price,
-                base_currency,
-                local_currency
-            )
-
-            # Convert back to EUR for comparison
-            price_in_eur = self.currency_converter.convert(
-                price_in_local,
-                local_currency,
-                'EUR'
-            )
-
+        # Numeric work and formatting are memoized; only the dicts are built
+        # per call.
+        for country, multiplier, local_currency, price_in_local, price_in_eur, savings, savings_pct, price_formatted in _compute_regional(round(base_price, 2), base_currency):
             regional_prices.append({
                 'country': country,
                 'country_name': self._get_country_name(country),
                 'currency': local_currency,
-                'price_local': round(price_in_local, 2),
-                'price_eur': round(price_in_eur, 2),
-                'price_formatted': self.currency_converter.format_price(price_in_local, local_currency),
+                'price_local': price_in_local,
+                'price_eur': price_in_eur,
+                'price_formatted': price_formatted,
                 'multiplier': multiplier,
                 'vpn_recommended': self._should_use_vpn(country),
-                'savings_vs_germany': round(base_price - price_in_eur, 2),
-                'savings_percentage': round(((base_price - price_in_eur) / base_price * 100), 2)
+                'savings_vs_germany': savings,
+                'savings_percentage': savings_pct
             })
 
-        # Sort by EUR price
-        regional_prices.sort(key=lambda x: x['price_eur'])
-
+        # Already sorted by EUR price (cached rows are stored in that order)
         return regional_prices
 
+    def simulate_regional_pricing_batch(
+        self,
+        base_prices: List[float],
+        base_currency: str = 'EUR'
+    ) -> Dict[str, Any]:
+        """
+        Price many routes against all markets in one pass.
+
+        Returns the market column order plus one row of EUR prices per input
+        price, without materializing per-market dicts.
+        """
+        rates = _market_rates(base_currency)
+        countries = [r[0] for r in rates]
+        eur_factors = [r[4] for r in rates]
+
+        return {
+            'countries': countries,
+            'prices_eur': [
+                [round(price * factor, 2) for factor in eur_factors]
+                for price in base_prices
+            ]
+        }
+
     def find_cheapest_market(
         self,
         base_price: float,
@@ -138,6 +329,11 @@ class GeoPricingAnalyzer:
         cheapest = regional_prices[0]
         most_expensive = regional_prices[-1]
 
+        # Average over the cached numeric rows rather than re-walking the
+        # materialized dicts.
+        rows = _compute_regional(round(base_price, 2), base_currency)
+        average_eur = sum(r[4] for r in rows) / len(rows)
+
         # Calculate maximum possible savings
         max_savings = most_expensive['price_eur'] - cheapest['price_eur']
         max_savings_pct = (max_savings / most_expensive['price_eur'] * 100)
@@ -152,7 +348,7 @@ class GeoPricingAnalyzer:
             'price_spread': {
                 'min': cheapest['price_eur'],
                 'max': most_expensive['price_eur'],
-                'average': round(sum(p['price_eur'] for p in regional_prices) / len(regional_prices), 2)
+                'average': round(average_eur, 2)
             }
         }
 
@@ -184,28 +380,7 @@ class GeoPricingAnalyzer:
             })
 
         # Add general factors
-        reasons.extend([
-            {
-                'factor': 'Local Competition',
-                'impact': 'High',
-                'explanation': 'Markets with more competition (like Poland, Spain) often have lower prices.'
-            },
-            {
-                'factor': 'Purchasing Power',
-                'impact': 'Medium',
-                'explanation': 'Airlines adjust prices based on average income levels in each country.'
-            },
-            {
-                'factor': 'Local Taxes & Fees',
-                'impact': 'Medium',
-                'explanation': 'Different countries have different aviation taxes and airport fees.'
-            },
-            {
-                'factor': 'Point of Sale Rules',
-                'impact': 'Medium',
-                'explanation': 'Airlines segment markets and apply different pricing rules per region.'
-            }
-        ])
+        reasons.extend(_GENERAL_FACTORS)
 
         return {
             'country1': {'code': country1, 'name': self._get_country_name(country1)},
@@ -221,107 +396,24 @@ class GeoPricingAnalyzer:
         IMPORTANT: This is for educational purposes. Always comply with
         airline terms of service and local laws.
         """
-        methods = [
-            {
-                'method': 'VPN Service',
-                'legality': 'Gray Area',
-                'description': 'Use VPN to appear to browse from target country',
-                'risks': [
-                    'May violate airline Terms of Service',
-                    'Booking might be cancelled if detected',
-                    'Payment card address might not match'
-                ],
-                'tips': [
-                    'Clear cookies before connecting to VPN',
-                    'Use incognito/private browsing',
-                    'Consider using local payment method if possible'
-                ]
-            },
-            {
-                'method': 'Local Travel Agency',
-                'legality': 'Fully Legal',
-                'description': 'Contact travel agency in target country to book',
-                'risks': ['Service fees may offset savings'],
-                'tips': [
-                    'Find agencies that serve international clients',
-                    'Ask for quote before committing',
-                    'Ensure they provide proper documentation'
-                ]
-            },
-            {
-                'method': 'Local Credit Card',
-                'legality': 'Fully Legal',
-                'description': 'Use credit card issued in target country',
-                'risks': ['Need to have legitimate card from that country'],
-                'tips': [
-                    'Some international banks issue cards in multiple countries',
-                    'Transferwise/Revolut cards may help'
-                ]
-            },
-            {
-                'method': 'Book While Physically Present',
-                'legality': 'Fully Legal',
-                'description': 'Book while actually in the target country',
-                'risks': ['Need to travel there first'],
-                'tips': [
-                    'Good for future bookings if you visit frequently',
-                    'Use local SIM card for extra authenticity'
-                ]
-            },
-            {
-                'method': 'Multi-Currency Booking Sites',
-                'legality': 'Fully Legal',
-                'description': 'Use OTAs that allow currency/region selection',
-                'risks': ['Limited options, may have fees'],
-                'tips': [
-                    'Compare prices in different currencies',
-                    'Check if card charges foreign transaction fees'
-                ]
-            }
-        ]
-
-        warnings = [
-            'Always read airline Terms of Service',
-            'Misrepresenting your location may lead to booking cancellation',
-            'Ensure payment card billing address matches',
-            'Some countries have laws against VPN usage',
-            'Consider tax implications of international bookings'
-        ]
-
         return {
             'target_country': self._get_country_name(target_country),
-            'methods': methods,
-            'warnings': warnings,
+            'methods': _LEGAL_METHODS,
+            'warnings': _LEGAL_WARNINGS,
             'recommended_approach': self._get_recommended_approach(target_country)
         }
 
     def _get_country_currency(self, country_code: str) -> str:
         """Get primary currency for country."""
-        currency_map = {
-            'DE': 'EUR', 'FR': 'EUR', 'IT': 'EUR', 'ES': 'EUR', 'NL': 'EUR',
-            'GB': 'GBP', 'US': 'USD', 'CH': 'CHF', 'PL': 'PLN', 'TR': 'TRY',
-            'IN': 'INR', 'TH': 'THB', 'AE': 'AED', 'SG': 'USD', 'AU': 'AUD',
-            'BR': 'USD', 'MX': 'USD', 'AR': 'USD'
-        }
-        return currency_map.get(country_code, 'EUR')
+        return self._COUNTRY_CURRENCIES.get(country_code, 'EUR')
 
     def _get_country_name(self, country_code: str) -> str:
         """Get country name from code."""
-        names = {
-            'DE': 'Germany', 'FR': 'France', 'GB': 'United Kingdom',
-            'US': 'United States', 'CH': 'Switzerland', 'ES': 'Spain',
-            'IT': 'Italy', 'NL': 'Netherlands', 'PL': 'Poland',
-            'TR': 'Turkey', 'IN': 'India', 'TH': 'Thailand',
-            'AE': 'UAE', 'SG': 'Singapore', 'AU': 'Australia',
-            'BR': 'Brazil', 'MX': 'Mexico', 'AR': 'Argentina'
-        }
-        return names.get(country_code, country_code)
+        return self._COUNTRY_NAMES.get(country_code, country_code)
 
     def _should_use_vpn(self, country: str) -> bool:
         """Determine if VPN would help access this market."""
-        # Countries where geo-pricing differences are significant
-        significant_diff = ['PL', 'TR', 'IN', 'TH', 'AR', 'MX', 'BR']
-        return country in significant_diff
+        return country in self._VPN_COUNTRIES
 
     def _generate_recommendation(
         self,
@@ -349,6 +441,12 @@ class GeoPricingAnalyzer:
             return "Evaluate if savings justify the complexity. Local travel agency is safest approach."
 
 
+@functools.cache
+def _default_analyzer() -> 'GeoPricingAnalyzer':
+    """Shared analyzer for the convenience functions."""
+    return GeoPricingAnalyzer()
+
+
 def compare_markets_for_route(
     origin: str,
     destination: str,
@@ -360,7 +458,7 @@ def compare_markets_for_route(
 
     Convenience function for quick market comparison.
     """
-    analyzer = GeoPricingAnalyzer()
+    analyzer = _default_analyzer()
 
     if markets_to_compare is None:
         markets_to_compare = ['DE', 'PL', 'TR', 'IN', 'GB', 'US']
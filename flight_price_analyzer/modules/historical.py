@@ -5,9 +5,236 @@ Uses historical airline pricing behavior to identify optimal booking windows and
 
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from .utils import FlightLogger, DateHelper
+import bisect
+import functools
+from .utils import FlightLogger, DateHelper, AirportHelper
 import calendar
 
+# Shared helper for route classification; AirportHelper is stateless over its
+# class-level airport table
+_AIRPORT_HELPER = AirportHelper()
+
+# European countries treated as one continent for route classification
+_EU_COUNTRIES = frozenset({'DE', 'FR', 'IT', 'ES', 'NL', 'GB', 'PL', 'AT', 'CH'})
+
+# Major business hubs; routes between two of these skew towards weekday demand
+_BUSINESS_HUBS = frozenset({'FRA', 'LHR', 'JFK', 'DXB'})
+
+# Shared route-character results (treated as read-only by callers)
+_BUSINESS_ROUTE = {
+    'type': 'business',
+    'description': 'Business route with weekday demand'
+}
+_LEISURE_ROUTE = {
+    'type': 'leisure',
+    'description': 'Leisure route with weekend demand'
+}
+
+
+# Weekday/month names indexed by date.weekday() / date.month - 1; avoids the
+# strftime locale machinery on every name lookup
+_WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_MONTHS = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
+# Per-weekday demand results, prebuilt once and indexed by date.weekday()
+_DAY_DEMAND = tuple(
+    {
+        'day': day,
+        'demand_level': 'high' if day in ('Friday', 'Saturday', 'Sunday') else 'moderate',
+        'reason': 'Weekend leisure travel' if day in ('Friday', 'Saturday', 'Sunday') else 'Weekday travel'
+    }
+    for day in _WEEKDAYS
+)
+
+# Default event-impact result (no events database wired up)
+_NO_EVENT_IMPACT = {
+    'events_found': False,
+    'description': 'No major events detected',
+    'impact': 'none'
+}
+
+# Static fare-reset schedule returned by identify_fare_reset_times
+_FARE_RESET_TIMES = {
+    'daily_resets': [
+        {
+            'time': '12:00 AM - 2:00 AM EST',
+            'frequency': 'Daily',
+            'what_happens': 'Automated fare updates, expired sales removed',
+            'opportunity': 'New inventory released at base fares'
+        },
+        {
+            'time': '3:00 AM - 5:00 AM Local',
+            'frequency': 'Daily',
+            'what_happens': 'Regional fare adjustments',
+            'opportunity': 'Catch pricing errors before correction'
+        }
+    ],
+    'weekly_resets': [
+        {
+            'time': 'Monday 5:00 PM - 11:59 PM EST',
+            'frequency': 'Weekly',
+            'what_happens': 'Airlines release weekend sales',
+            'opportunity': 'New sale fares available'
+        },
+        {
+            'time': 'Tuesday 3:00 PM EST',
+            'frequency': 'Weekly',
+            'what_happens': 'Competitors match Monday sales',
+            'opportunity': 'Best time to find matching lower prices'
+        }
+    ],
+    'inventory_releases': [
+        {
+            'timing': '330 days before departure',
+            'what_happens': 'Initial schedule release',
+            'opportunity': 'Early bird fares (not always cheapest)'
+        },
+        {
+            'timing': '90-120 days before departure',
+            'what_happens': 'Major inventory release',
+            'opportunity': 'Optimal pricing for most routes'
+        },
+        {
+            'timing': '21-30 days before departure',
+            'what_happens': 'Inventory assessment and repricing',
+            'opportunity': 'Last chance for good deals before last-minute surge'
+        },
+        {
+            'timing': '7 days before departure',
+            'what_happens': 'Last-minute premium pricing',
+            'opportunity': 'Only for unsold inventory on unpopular routes'
+        }
+    ],
+    'best_search_times': [
+        'Tuesday 3:00 PM EST (weekly low point)',
+        'Wednesday 12:00 PM EST (mid-week stability)',
+        'Sunday 5:00 AM EST (weekend fare updates)'
+    ]
+}
+
+# Fallback season for months not covered by a peak or off-peak pattern
+_SHOULDER_SEASON = {
+    'name': 'Shoulder Season',
+    'multiplier': 1.0,
+    'booking_advance': 'Book 1-2 months ahead',
+    'note': 'Moderate demand'
+}
+
+# Relative price curves by route type, shared across analyses
+_HISTORICAL_PRICE_CURVES = {
+    'domestic': [
+        {'days_before': 90, 'relative_price': 1.1},
+        {'days_before': 60, 'relative_price': 0.95},
+        {'days_before': 30, 'relative_price': 0.92},
+        {'days_before': 21, 'relative_price': 0.90},  # Optimal
+        {'days_before': 14, 'relative_price': 0.95},
+        {'days_before': 7, 'relative_price': 1.15},
+        {'days_before': 3, 'relative_price': 1.30},
+        {'days_before': 1, 'relative_price': 1.40},
+    ],
+    'international': [
+        {'days_before': 180, 'relative_price': 1.0},
+        {'days_before': 120, 'relative_price': 0.92},
+        {'days_before': 90, 'relative_price': 0.88},
+        {'days_before': 60, 'relative_price': 0.85},  # Optimal
+        {'days_before': 30, 'relative_price': 0.90},
+        {'days_before': 14, 'relative_price': 1.10},
+        {'days_before': 7, 'relative_price': 1.35},
+        {'days_before': 1, 'relative_price': 1.50},
+    ]
+}
+
+# Column-oriented view of the curves for numeric work: ascending days_before
+# and the matching relative prices as aligned tuples
+_HISTORICAL_PRICE_CURVE_COLUMNS = {
+    route_type: (
+        tuple(point['days_before'] for point in reversed(curve)),
+        tuple(point['relative_price'] for point in reversed(curve))
+    )
+    for route_type, curve in _HISTORICAL_PRICE_CURVES.items()
+}
+
+
+def _build_day_impact_table(patterns):
+    """Map (context, day) -> formatted price impact string."""
+    table = {}
+    for day in patterns['best_days_to_fly']['days']:
+        table[('fly', day)] = f"-{patterns['best_days_to_fly']['average_savings']}"
+    for day in patterns['worst_days_to_fly']['days']:
+        table[('fly', day)] = f"+{patterns['worst_days_to_fly']['average_markup']}"
+    for day in patterns['best_days_to_book']['days']:
+        table[('book', day)] = f"-{patterns['best_days_to_book']['average_savings']}"
+    for day in patterns['worst_days_to_book']['days']:
+        table[('book', day)] = f"+{patterns['worst_days_to_book']['average_markup']}"
+    return table
+
+
+def _build_day_flags(patterns):
+    """Per-weekday (good_fly, bad_fly, good_book, bad_book) flag tuples."""
+    best_fly = set(patterns['best_days_to_fly']['days'])
+    worst_fly = set(patterns['worst_days_to_fly']['days'])
+    best_book = set(patterns['best_days_to_book']['days'])
+    worst_book = set(patterns['worst_days_to_book']['days'])
+    return tuple(
+        (day in best_fly, day in worst_fly, day in best_book, day in worst_book)
+        for day in _WEEKDAYS
+    )
+
+
+def _build_month_season_table(seasonal_patterns):
+    """Map month -> season dict, with peak seasons taking precedence."""
+    table = {}
+    for season in seasonal_patterns['peak_seasons'] + seasonal_patterns['off_peak_seasons']:
+        for month in season['months']:
+            table.setdefault(month, season)
+    return table
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_route_cached(origin: str, destination: str) -> str:
+    """Classify a route as domestic, international, or intercontinental."""
+    # Simplified - in production, use actual airport database
+    origin_info = _AIRPORT_HELPER.get_airport_info(origin)
+    dest_info = _AIRPORT_HELPER.get_airport_info(destination)
+
+    if not origin_info or not dest_info:
+        return 'international'
+
+    if origin_info['country'] == dest_info['country']:
+        return 'domestic'
+
+    # Check if same continent (simplified)
+    if origin_info['country'] in _EU_COUNTRIES and dest_info['country'] in _EU_COUNTRIES:
+        return 'international'
+
+    return 'intercontinental'
+
+
+@functools.lru_cache(maxsize=1024)
+def _comprehensive_cached(
+    analyzer: 'HistoricalPricingAnalyzer',
+    origin: str,
+    destination: str,
+    departure_iso: str,
+    return_iso: Optional[str],
+    today_iso: str
+) -> Dict[str, Any]:
+    """
+    Memoized comprehensive analysis, keyed on route, dates and today's date.
+
+    today_iso busts the cache daily since the booking-window math depends on
+    datetime.now().
+    """
+    return analyzer._build_comprehensive(
+        origin,
+        destination,
+        datetime.fromisoformat(departure_iso),
+        datetime.fromisoformat(return_iso) if return_iso else None
+    )
+
 
 class HistoricalPricingAnalyzer:
     """
@@ -109,6 +336,28 @@ class HistoricalPricingAnalyzer:
         ]
     }
 
+    # Month -> season lookup derived once from SEASONAL_PATTERNS; replaces the
+    # per-call scan over both season lists.
+    _MONTH_TO_SEASON = _build_month_season_table(SEASONAL_PATTERNS)
+
+    # Frozen membership sets derived from DAY_OF_WEEK_PATTERNS; the pattern
+    # dict keeps ordered lists for JSON output, these give O(1) lookups.
+    _BEST_FLY_DAYS = frozenset(DAY_OF_WEEK_PATTERNS['best_days_to_fly']['days'])
+    _WORST_FLY_DAYS = frozenset(DAY_OF_WEEK_PATTERNS['worst_days_to_fly']['days'])
+    _BEST_BOOK_DAYS = frozenset(DAY_OF_WEEK_PATTERNS['best_days_to_book']['days'])
+    _WORST_BOOK_DAYS = frozenset(DAY_OF_WEEK_PATTERNS['worst_days_to_book']['days'])
+
+    # (context, day) -> impact string, prebuilt from the same pattern data
+    _DAY_PRICE_IMPACT = _build_day_impact_table(DAY_OF_WEEK_PATTERNS)
+
+    # weekday() -> (good_fly, bad_fly, good_book, bad_book), one index
+    # replaces four membership checks in analyze_day_of_week
+    _DAY_FLAGS = _build_day_flags(DAY_OF_WEEK_PATTERNS)
+
+    # Demand-score ladder: score < 1 Low, < 3 Moderate, < 5 High, else Very High
+    _DEMAND_THRESHOLDS = (1, 3, 5)
+    _DEMAND_LABELS = ('Low', 'Moderate', 'High', 'Very High')
+
     TIME_OF_DAY_PATTERNS = {
         'best_times_to_book': [
             {'time': '3:00 AM - 5:00 AM', 'reason': 'Automated fare resets', 'savings': 'Variable'},
@@ -120,6 +369,8 @@ class HistoricalPricingAnalyzer:
         ]
     }
 
+    __slots__ = ('logger',)
+
     def __init__(self, logger: Optional[FlightLogger] = None):
         self.logger = logger or FlightLogger("HistoricalPricing")
 
@@ -127,19 +378,24 @@ class HistoricalPricingAnalyzer:
         self,
         origin: str,
         destination: str,
-        departure_date: datetime
+        departure_date: datetime,
+        today: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """
         Analyze optimal booking window for a specific route.
+
+        today lets aggregated callers share one clock read; standalone
+        callers get datetime.now().
         """
-        self.logger.info(f"Analyzing booking window for {origin} → {destination}")
+        self.logger.info("Analyzing booking window for %s → %s", origin, destination)
 
         # Determine route type
         route_type = self._classify_route(origin, destination)
         pattern = self.BOOKING_WINDOW_PATTERNS[route_type]
 
         # Calculate current booking window
-        today = datetime.now()
+        if today is None:
+            today = datetime.now()
         days_until_departure = (departure_date - today).days
 
         # Determine if currently in optimal window
@@ -153,11 +409,11 @@ class HistoricalPricingAnalyzer:
 
         analysis = {
             'route_type': route_type,
-            'departure_date': departure_date.strftime('%Y-%m-%d'),
+            'departure_date': departure_date.date().isoformat(),
             'days_until_departure': days_until_departure,
             'optimal_booking_window': {
-                'start_date': optimal_start.strftime('%Y-%m-%d'),
-                'end_date': optimal_end.strftime('%Y-%m-%d'),
+                'start_date': optimal_start.date().isoformat(),
+                'end_date': optimal_end.date().isoformat(),
                 'days_before': pattern['optimal_days_before']
             },
             'currently_optimal': in_optimal_window,
@@ -181,21 +437,16 @@ class HistoricalPricingAnalyzer:
         if booking_date is None:
             booking_date = datetime.now()
 
-        departure_day = departure_date.strftime('%A')
-        booking_day = booking_date.strftime('%A')
-
-        # Check if departure day is optimal
-        is_good_departure_day = departure_day in self.DAY_OF_WEEK_PATTERNS['best_days_to_fly']['days']
-        is_bad_departure_day = departure_day in self.DAY_OF_WEEK_PATTERNS['worst_days_to_fly']['days']
+        departure_day = _WEEKDAYS[departure_date.weekday()]
+        booking_day = _WEEKDAYS[booking_date.weekday()]
 
-        # Check if booking day is optimal
-        is_good_booking_day = booking_day in self.DAY_OF_WEEK_PATTERNS['best_days_to_book']['days']
-        is_bad_booking_day = booking_day in self.DAY_OF_WEEK_PATTERNS['worst_days_to_book']['days']
+        # Check if departure and booking days are optimal
+        is_good_departure_day, is_bad_departure_day, _, _ = self._DAY_FLAGS[departure_date.weekday()]
+        _, _, is_good_booking_day, is_bad_booking_day = self._DAY_FLAGS[booking_date.weekday()]
 
         # Find better alternative days
         better_departure_days = self._find_better_days(
-            departure_date,
-            self.DAY_OF_WEEK_PATTERNS['best_days_to_fly']['days']
+            departure_date, self._BEST_FLY_DAYS
         )
 
         analysis = {
@@ -240,8 +491,8 @@ class HistoricalPricingAnalyzer:
         seasonal_price = base_price * multiplier
 
         analysis = {
-            'departure_date': departure_date.strftime('%Y-%m-%d'),
-            'month': departure_date.strftime('%B'),
+            'departure_date': departure_date.date().isoformat(),
+            'month': _MONTHS[departure_date.month - 1],
             'season': season_info,
             'price_impact': {
                 'multiplier': multiplier,
@@ -262,63 +513,7 @@ class HistoricalPricingAnalyzer:
         """
         Identify when airlines typically reset fares.
         """
-        return {
-            'daily_resets': [
-                {
-                    'time': '12:00 AM - 2:00 AM EST',
-                    'frequency': 'Daily',
-                    'what_happens': 'Automated fare updates, expired sales removed',
-                    'opportunity': 'New inventory released at base fares'
-                },
-                {
-                    'time': '3:00 AM - 5:00 AM Local',
-                    'frequency': 'Daily',
-                    'what_happens': 'Regional fare adjustments',
-                    'opportunity': 'Catch pricing errors before correction'
-                }
-            ],
-            'weekly_resets': [
-                {
-                    'time': 'Monday 5:00 PM - 11:59 PM EST',
-                    'frequency': 'Weekly',
-                    'what_happens': 'Airlines release weekend sales',
-                    'opportunity': 'New sale fares available'
-                },
-                {
-                    'time': 'Tuesday 3:00 PM EST',
-                    'frequency': 'Weekly',
-                    'what_happens': 'Competitors match Monday sales',
-                    'opportunity': 'Best time to find matching lower prices'
-                }
-            ],
-            'inventory_releases': [
-                {
-                    'timing': '330 days before departure',
-                    'what_happens': 'Initial schedule release',
-                    'opportunity': 'Early bird fares (not always cheapest)'
-                },
-                {
-                    'timing': '90-120 days before departure',
-                    'what_happens': 'Major inventory release',
-                    'opportunity': 'Optimal pricing for most routes'
-                },
-                {
-                    'timing': '21-30 days before departure',
-                    'what_happens': 'Inventory assessment and repricing',
-                    'opportunity': 'Last chance for good deals before last-minute surge'
-                },
-                {
-                    'timing': '7 days before departure',
-                    'what_happens': 'Last-minute premium pricing',
-                    'opportunity': 'Only for unsold inventory on unpopular routes'
-                }
-            ],
-            'best_search_times': [
-                'Tuesday 3:00 PM EST (weekly low point)',
-                'Wednesday 12:00 PM EST (mid-week stability)',
-                'Sunday 5:00 AM EST (weekend fare updates)'
-            ]
-        }
+        return _FARE_RESET_TIMES
 
     def analyze_demand_cycles(
         self,
@@ -363,15 +558,61 @@ class HistoricalPricingAnalyzer:
     ) -> Dict[str, Any]:
         """
         Comprehensive historical analysis combining all factors.
+
+        Results are memoized per calendar day: the analysis is deterministic
+        given its inputs and today's date, so repeat queries skip the whole
+        sub-analysis tree.
         """
-        self.logger.info(f"Performing comprehensive historical analysis")
+        self.logger.info("Performing comprehensive historical analysis")
+
+        cached = _comprehensive_cached(
+            self,
+            origin,
+            destination,
+            departure_date.isoformat(),
+            return_date.isoformat() if return_date else None,
+            datetime.now().date().isoformat()
+        )
+        # Shallow copy so callers can attach fields without touching the cache
+        return dict(cached)
+
+    def analyze_batch(
+        self,
+        routes: List[Tuple[str, str, datetime]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many (origin, destination, departure_date) routes in one call.
+
+        Shares one today-key across the batch so repeated routes hit the
+        memoized comprehensive analysis instead of re-running the sub-analyses.
+        """
+        self.logger.info("Batch analyzing %s routes", len(routes))
+
+        today_iso = datetime.now().date().isoformat()
+        return [
+            dict(_comprehensive_cached(
+                self, origin, destination, departure_date.isoformat(), None, today_iso
+            ))
+            for origin, destination, departure_date in routes
+        ]
+
+    def _build_comprehensive(
+        self,
+        origin: str,
+        destination: str,
+        departure_date: datetime,
+        return_date: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """Uncached body of get_comprehensive_analysis."""
+        # One clock read shared by every sub-analysis
+        now = datetime.now()
 
         analysis = {
             'route': f"{origin} → {destination}",
-            'departure_date': departure_date.strftime('%Y-%m-%d'),
-            'return_date': return_date.strftime('%Y-%m-%d') if return_date else None,
-            'booking_window_analysis': self.analyze_booking_window(origin, destination, departure_date),
-            'day_of_week_analysis': self.analyze_day_of_week(departure_date),
+            'departure_date': departure_date.date().isoformat(),
+            'return_date': return_date.date().isoformat() if return_date else None,
+            'booking_window_analysis': self.analyze_booking_window(origin, destination, departure_date, today=now),
+            'day_of_week_analysis': self.analyze_day_of_week(departure_date, booking_date=now),
             'seasonal_analysis': self.analyze_seasonal_pricing(departure_date),
             'fare_reset_times': self.identify_fare_reset_times(),
             'demand_cycle_analysis': self.analyze_demand_cycles(origin, destination, departure_date),
@@ -387,25 +628,7 @@ class HistoricalPricingAnalyzer:
 
     def _classify_route(self, origin: str, destination: str) -> str:
         """Classify route as domestic, international, or intercontinental."""
-        # Simplified - in production, use actual airport database
-        from .utils import AirportHelper
-        helper = AirportHelper()
-
-        origin_info = helper.get_airport_info(origin)
-        dest_info = helper.get_airport_info(destination)
-
-        if not origin_info or not dest_info:
-            return 'international'
-
-        if origin_info['country'] == dest_info['country']:
-            return 'domestic'
-
-        # Check if same continent (simplified)
-        eu_countries = ['DE', 'FR', 'IT', 'ES', 'NL', 'GB', 'PL', 'AT', 'CH']
-        if origin_info['country'] in eu_countries and dest_info['country'] in eu_countries:
-            return 'international'
-
-        return 'intercontinental'
+        return _classify_route_cached(origin, destination)
 
     def _generate_booking_recommendation(
         self,
@@ -426,56 +649,51 @@ class HistoricalPricingAnalyzer:
 
     def _get_historical_price_curve(self, route_type: str) -> List[Dict[str, Any]]:
         """Get historical price curve for route type."""
-        curves = {
-            'domestic': [
-                {'days_before': 90, 'relative_price': 1.1},
-                {'days_before': 60, 'relative_price': 0.95},
-                {'days_before': 30, 'relative_price': 0.92},
-                {'days_before': 21, 'relative_price': 0.90},  # Optimal
-                {'days_before': 14, 'relative_price': 0.95},
-                {'days_before': 7, 'relative_price': 1.15},
-                {'days_before': 3, 'relative_price': 1.30},
-                {'days_before': 1, 'relative_price': 1.40},
-            ],
-            'international': [
-                {'days_before': 180, 'relative_price': 1.0},
-                {'days_before': 120, 'relative_price': 0.92},
-                {'days_before': 90, 'relative_price': 0.88},
-                {'days_before': 60, 'relative_price': 0.85},  # Optimal
-                {'days_before': 30, 'relative_price': 0.90},
-                {'days_before': 14, 'relative_price': 1.10},
-                {'days_before': 7, 'relative_price': 1.35},
-                {'days_before': 1, 'relative_price': 1.50},
-            ]
-        }
-        return curves.get(route_type, curves['international'])
+        return _HISTORICAL_PRICE_CURVES.get(route_type, _HISTORICAL_PRICE_CURVES['international'])
+
+    def get_price_at_days_before(self, route_type: str, days_before: int) -> float:
+        """
+        Interpolate the relative price at an arbitrary days-before-departure.
 
-    def _find_better_days(self, target_date: datetime, good_days: List[str]) -> List[Dict[str, str]]:
+        Works off the column-oriented curve view; values outside the curve
+        clamp to its endpoints.
+        """
+        days, prices = _HISTORICAL_PRICE_CURVE_COLUMNS.get(
+            route_type, _HISTORICAL_PRICE_CURVE_COLUMNS['international']
+        )
+        if days_before <= days[0]:
+            return prices[0]
+        if days_before >= days[-1]:
+            return prices[-1]
+
+        idx = bisect.bisect_left(days, days_before)
+        if days[idx] == days_before:
+            return prices[idx]
+        lo_day, hi_day = days[idx - 1], days[idx]
+        lo_price, hi_price = prices[idx - 1], prices[idx]
+        fraction = (days_before - lo_day) / (hi_day - lo_day)
+        return lo_price + fraction * (hi_price - lo_price)
+
+    def _find_better_days(self, target_date: datetime, good_days: frozenset) -> List[Dict[str, str]]:
         """Find better alternative days near target date."""
         alternatives = []
-        for offset in [-3, -2, -1, 1, 2, 3]:
-            alt_date = target_date + timedelta(days=offset)
-            if alt_date.strftime('%A') in good_days:
+        base_weekday = target_date.weekday()
+        for offset in (-3, -2, -1, 1, 2, 3):
+            # Weekday of the shifted date via modular arithmetic; the actual
+            # datetime is only built for days that qualify
+            day_name = _WEEKDAYS[(base_weekday + offset) % 7]
+            if day_name in good_days:
+                alt_date = target_date + timedelta(days=offset)
                 alternatives.append({
-                    'date': alt_date.strftime('%Y-%m-%d'),
-                    'day': alt_date.strftime('%A'),
+                    'date': alt_date.date().isoformat(),
+                    'day': day_name,
                     'offset': offset
                 })
         return alternatives[:3]  # Top 3 alternatives
 
     def _get_day_price_impact(self, day: str, context: str) -> str:
         """Get price impact for specific day."""
-        if context == 'fly':
-            if day in self.DAY_OF_WEEK_PATTERNS['best_days_to_fly']['days']:
-                return f"-{self.DAY_OF_WEEK_PATTERNS['best_days_to_fly']['average_savings']}"
-            elif day in self.DAY_OF_WEEK_PATTERNS['worst_days_to_fly']['days']:
-                return f"+{self.DAY_OF_WEEK_PATTERNS['worst_days_to_fly']['average_markup']}"
-        else:  # book
-            if day in self.DAY_OF_WEEK_PATTERNS['best_days_to_book']['days']:
-                return f"-{self.DAY_OF_WEEK_PATTERNS['best_days_to_book']['average_savings']}"
-            elif day in self.DAY_OF_WEEK_PATTERNS['worst_days_to_book']['days']:
-                return f"+{self.DAY_OF_WEEK_PATTERNS['worst_days_to_book']['average_markup']}"
-        return "0%"
+        return self._DAY_PRICE_IMPACT.get((context, day), "0%")
 
     def _generate_day_recommendation(
         self,
@@ -496,46 +714,18 @@ class HistoricalPricingAnalyzer:
 
     def _identify_season(self, month: int, date: datetime) -> Dict[str, Any]:
         """Identify which season the date falls into."""
-        # Check peak seasons
-        for season in self.SEASONAL_PATTERNS['peak_seasons']:
-            if month in season['months']:
-                return season
-
-        # Check off-peak seasons
-        for season in self.SEASONAL_PATTERNS['off_peak_seasons']:
-            if month in season['months']:
-                return season
-
-        # Default shoulder season
-        return {
-            'name': 'Shoulder Season',
-            'multiplier': 1.0,
-            'booking_advance': 'Book 1-2 months ahead',
-            'note': 'Moderate demand'
-        }
+        return self._MONTH_TO_SEASON.get(month, _SHOULDER_SEASON)
 
     def _classify_route_character(self, origin: str, destination: str) -> Dict[str, Any]:
         """Classify if route is business or leisure oriented."""
         # Simplified logic
-        business_hubs = ['FRA', 'LHR', 'JFK', 'DXB']
-
-        is_business = origin in business_hubs and destination in business_hubs
-
-        return {
-            'type': 'business' if is_business else 'leisure',
-            'description': 'Business route with weekday demand' if is_business else 'Leisure route with weekend demand'
-        }
+        if origin in _BUSINESS_HUBS and destination in _BUSINESS_HUBS:
+            return _BUSINESS_ROUTE
+        return _LEISURE_ROUTE
 
     def _analyze_day_demand(self, date: datetime) -> Dict[str, Any]:
         """Analyze demand based on day of week."""
-        day = date.strftime('%A')
-        is_weekend = day in ['Friday', 'Saturday', 'Sunday']
-
-        return {
-            'day': day,
-            'demand_level': 'high' if is_weekend else 'moderate',
-            'reason': 'Weekend leisure travel' if is_weekend else 'Weekday travel'
-        }
+        return _DAY_DEMAND[date.weekday()]
 
     def _analyze_seasonal_demand(self, date: datetime) -> Dict[str, Any]:
         """Analyze seasonal demand."""
@@ -550,11 +740,7 @@ class HistoricalPricingAnalyzer:
     def _check_event_impact(self, destination: str, date: datetime) -> Dict[str, Any]:
         """Check for major events impacting demand."""
         # Simplified - in production, check events database
-        return {
-            'events_found': False,
-            'description': 'No major events detected',
-            'impact': 'none'
-        }
+        return _NO_EVENT_IMPACT
 
     def _calculate_overall_demand(
         self,
@@ -564,28 +750,13 @@ class HistoricalPricingAnalyzer:
         event_impact: Dict
     ) -> str:
         """Calculate overall demand level."""
-        demand_score = 0
-
-        if route_char['type'] == 'business':
-            demand_score += 1
-
-        if day_demand['demand_level'] == 'high':
-            demand_score += 2
-
-        if seasonal_demand['demand_level'] == 'high':
-            demand_score += 3
-
-        if event_impact['impact'] != 'none':
-            demand_score += 2
-
-        if demand_score >= 5:
-            return 'Very High'
-        elif demand_score >= 3:
-            return 'High'
-        elif demand_score >= 1:
-            return 'Moderate'
-        else:
-            return 'Low'
+        demand_score = (
+            (route_char['type'] == 'business')
+            + 2 * (day_demand['demand_level'] == 'high')
+            + 3 * (seasonal_demand['demand_level'] == 'high')
+            + 2 * (event_impact['impact'] != 'none')
+        )
+        return self._DEMAND_LABELS[bisect.bisect_right(self._DEMAND_THRESHOLDS, demand_score)]
 
     def _generate_demand_recommendation(
         self,
@@ -606,16 +777,18 @@ class HistoricalPricingAnalyzer:
     def _generate_overall_recommendation(self, analysis: Dict[str, Any]) -> str:
         """Generate overall recommendation from all analyses."""
         recommendations = []
+        booking_window = analysis['booking_window_analysis']
+        departure_analysis = analysis['day_of_week_analysis']['departure_analysis']
 
         # Booking window
-        if analysis['booking_window_analysis']['currently_optimal']:
+        if booking_window['currently_optimal']:
             recommendations.append("✓ In optimal booking window")
         else:
-            recommendations.append(analysis['booking_window_analysis']['recommendation'])
+            recommendations.append(booking_window['recommendation'])
 
         # Day of week
-        if not analysis['day_of_week_analysis']['departure_analysis']['is_optimal']:
-            alternatives = analysis['day_of_week_analysis']['departure_analysis']['better_alternatives']
+        if not departure_analysis['is_optimal']:
+            alternatives = departure_analysis['better_alternatives']
             if alternatives:
                 recommendations.append(f"Consider alternative date: {alternatives[0]['date']}")
 
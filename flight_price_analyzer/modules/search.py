@@ -3,18 +3,143 @@ Flight search module with advanced routing strategies.
 Implements hidden city ticketing, nearby airports, and multi-leg combinations.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import itertools
+import functools
+import math
+import random
+from operator import attrgetter
 from .utils import (
     FlightLogger, AirportHelper, DateHelper,
-    format_duration, calculate_price_difference
+    format_duration
 )
 
 
+# Sort key for route lists; C-implemented, cheaper than a lambda per element
+_PRICE = attrgetter('price')
+
+# One helper shared by every engine instance; AirportHelper is stateless
+_AIRPORT_HELPER = AirportHelper()
+
+# Country per airport code, pre-extracted for the pricing kernel's
+# international check so it skips the full airport-info lookup
+_COUNTRY_BY_CODE: Dict[str, str] = {
+    code: info['country'] for code, info in AirportHelper.AIRPORTS.items()
+}
+
+# Major European and international hubs considered for multi-leg splits
+_HUBS = ('FRA', 'AMS', 'CDG', 'LHR', 'MUC', 'IST', 'DXB', 'DOH')
+
+# Cities that could lie beyond a destination for hidden city tickets.
+# Simplified data - in production, use geographic data. Shared across
+# engine instances and treated as read-only by callers.
+_CITIES_BEYOND: Dict[str, Tuple[str, ...]] = {
+    'JFK': ('BOS', 'YUL', 'YYZ'),  # Beyond NYC
+    'LHR': ('DUB', 'MAN', 'EDI'),  # Beyond London
+    'CDG': ('AMS', 'BRU', 'LUX'),  # Beyond Paris
+    'FRA': ('MUC', 'VIE', 'ZRH'),  # Beyond Frankfurt
+    'DXB': ('DOH', 'AUH', 'MCT'),  # Beyond Dubai
+}
+
+# Approximate airport coordinates (lat, lon) used to prune geographically
+# implausible hubs. Sample data - in production, use a real airport database.
+_AIRPORT_COORDS: Dict[str, Tuple[float, float]] = {
+    'FRA': (50.04, 8.57), 'MUC': (48.35, 11.79), 'BER': (52.37, 13.50),
+    'HAM': (53.63, 9.99), 'DUS': (51.29, 6.77), 'CGN': (50.87, 7.14),
+    'STR': (48.69, 9.22), 'JFK': (40.64, -73.78), 'LHR': (51.47, -0.45),
+    'CDG': (49.01, 2.55), 'AMS': (52.31, 4.76), 'MAD': (40.47, -3.57),
+    'BCN': (41.30, 2.08), 'FCO': (41.80, 12.25), 'VIE': (48.11, 16.57),
+    'ZRH': (47.46, 8.55), 'DXB': (25.25, 55.36), 'BKK': (13.69, 100.75),
+    'SIN': (1.36, 103.99), 'HKG': (22.31, 113.91), 'NRT': (35.77, 140.39),
+    'SYD': (-33.95, 151.18), 'IST': (41.26, 28.74), 'DOH': (25.27, 51.61),
+}
+
+# A hub is a plausible split point when the detour through it stays within
+# this factor of the direct great-circle distance
+_MAX_DETOUR_FACTOR = 1.3
+
+
+def _great_circle_km(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    """Haversine great-circle distance in kilometres."""
+    lat1, lon1 = math.radians(a[0]), math.radians(a[1])
+    lat2, lon2 = math.radians(b[0]), math.radians(b[1])
+    h = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * 6371.0 * math.asin(math.sqrt(h))
+
+
+# Prebuilt leg shapes, copied and overlaid per leg instead of re-hashing
+# full dict literals in the hot search paths. These stay plain dicts on
+# purpose - legs go straight into the JSON-exported results.
+_DIRECT_LEG = {
+    'origin': '',
+    'destination': '',
+    'departure': '',
+    'arrival': '',
+    'airline': 'Sample Airline',
+    'flight_number': 'XX1234',
+    'duration': 120,  # minutes
+}
+
+_SPLIT_LEG = {
+    'origin': '',
+    'destination': '',
+    'departure': '',
+    'price': 0.0,
+    'booking_type': 'separate',
+}
+
+_BARE_LEG = {
+    'origin': '',
+    'destination': '',
+    'departure': '',
+}
+
+# Booking-window price multipliers applied in the pricing kernel;
+# statuses not listed here leave the price unchanged.
+_WINDOW_MULT = {
+    'very_late': 1.5,
+    'late': 1.2,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _booking_window_status(date_iso: str) -> str:
+    """
+    Memoized booking-window status for a calendar day.
+
+    A comprehensive search prices dozens of legs against the same one or
+    two travel dates; keying by ISO day means the window computation runs
+    once per date instead of once per probe.
+    """
+    return DateHelper.get_optimal_booking_window(datetime.fromisoformat(date_iso))['status']
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_base_price(engine: 'FlightSearchEngine', origin: str, destination: str, date_iso: str) -> float:
+    """
+    Memoized wrapper around FlightSearchEngine._calculate_base_price.
+
+    Keyed by ISO date rather than datetime so repeated probes for the same
+    route and day (hidden city comparisons, multi-leg pricing, nearby-airport
+    combinations) hit the cache instead of re-running the price simulation.
+    """
+    return engine._calculate_base_price(origin, destination, datetime.fromisoformat(date_iso))
+
+
 class FlightRoute:
     """Represents a flight route with pricing and details."""
 
+    # Routes are created by the dozen per comprehensive search; slots keep
+    # each instance small and attribute access on fixed offsets.
+    __slots__ = (
+        'origin', 'destination', 'departure_date', 'return_date',
+        'price', 'currency', 'legs', 'route_type', 'booking_link',
+        '_dep_iso', '_ret_iso', '_dict_cache',
+    )
+
     def __init__(
         self,
         origin: str,
@@ -36,21 +161,29 @@ class FlightRoute:
         self.legs = legs or []
         self.route_type = route_type
         self.booking_link = booking_link
+        # Dates serialized once; routes are often serialized more than once
+        # (comprehensive results plus legality ranking)
+        self._dep_iso = departure_date.isoformat()
+        self._ret_iso = return_date.isoformat() if return_date else None
+        self._dict_cache: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert route to dictionary."""
-        return {
-            'origin': self.origin,
-            'destination': self.destination,
-            'departure_date': self.departure_date.isoformat(),
-            'return_date': self.return_date.isoformat() if self.return_date else None,
-            'price': self.price,
-            'currency': self.currency,
-            'legs': self.legs,
-            'route_type': self.route_type,
-            'booking_link': self.booking_link,
-            'route_description': AirportHelper.format_route(self.origin, self.destination)
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'origin': self.origin,
+                'destination': self.destination,
+                'departure_date': self._dep_iso,
+                'return_date': self._ret_iso,
+                'price': self.price,
+                'currency': self.currency,
+                'legs': self.legs,
+                'route_type': self.route_type,
+                'booking_link': self.booking_link,
+                'route_description': AirportHelper.format_route(self.origin, self.destination)
+            }
+        # Shallow copy so callers can attach fields without touching the cache
+        return dict(self._dict_cache)
 
 
 class FlightSearchEngine:
@@ -66,7 +199,7 @@ class FlightSearchEngine:
 
     def __init__(self, logger: Optional[FlightLogger] = None):
         self.logger = logger or FlightLogger("FlightSearch")
-        self.airport_helper = AirportHelper()
+        self.airport_helper = _AIRPORT_HELPER
 
     def search_direct_flight(
         self,
@@ -82,28 +215,27 @@ class FlightSearchEngine:
         self.logger.info(f"Searching direct flight: {origin} → {destination}")
 
         # Simulate flight data (in production, query real APIs)
-        base_price = self._calculate_base_price(origin, destination, departure_date)
-
-        legs = [{
-            'origin': origin,
-            'destination': destination,
-            'departure': departure_date.isoformat(),
-            'arrival': departure_date.isoformat(),
-            'airline': 'Sample Airline',
-            'flight_number': 'XX1234',
-            'duration': 120  # minutes
-        }]
+        base_price = _cached_base_price(self, origin, destination, departure_date.date().isoformat())
+
+        dep_iso = departure_date.isoformat()
+        legs = [dict(
+            _DIRECT_LEG,
+            origin=origin,
+            destination=destination,
+            departure=dep_iso,
+            arrival=dep_iso
+        )]
 
         if return_date:
-            legs.append({
-                'origin': destination,
-                'destination': origin,
-                'departure': return_date.isoformat(),
-                'arrival': return_date.isoformat(),
-                'airline': 'Sample Airline',
-                'flight_number': 'XX5678',
-                'duration': 120
-            })
+            ret_iso = return_date.isoformat()
+            legs.append(dict(
+                _DIRECT_LEG,
+                origin=destination,
+                destination=origin,
+                departure=ret_iso,
+                arrival=ret_iso,
+                flight_number='XX5678'
+            ))
             base_price *= 1.8  # Round trip pricing
 
         return FlightRoute(
@@ -121,7 +253,8 @@ class FlightSearchEngine:
         self,
         origin: str,
         destination: str,
-        departure_date: datetime
+        departure_date: datetime,
+        direct_price: Optional[float] = None
     ) -> List[FlightRoute]:
         """
         Find hidden city ticket opportunities.
@@ -139,6 +272,11 @@ class FlightSearchEngine:
 
         hidden_city_routes = []
 
+        # Comparison threshold; callers that already priced the direct
+        # flight pass it in, otherwise compute it once before the loop
+        if direct_price is None:
+            direct_price = self._price_only(origin, destination, departure_date)
+
         # Major hub cities that could be beyond the destination
         potential_hidden_cities = self._get_cities_beyond(destination)
 
@@ -146,7 +284,7 @@ class FlightSearchEngine:
             # Check if route goes through actual destination
             route = self._simulate_layover_route(origin, hidden_dest, destination, departure_date)
 
-            if route and route.price < self.search_direct_flight(origin, destination, departure_date).price:
+            if route and route.price < direct_price:
                 route.route_type = 'hidden_city'
                 hidden_city_routes.append(route)
 
@@ -157,31 +295,47 @@ class FlightSearchEngine:
         origin: str,
         destination: str,
         departure_date: datetime,
-        return_date: Optional[datetime] = None
+        return_date: Optional[datetime] = None,
+        seen: Optional[Set[Tuple[str, str]]] = None
     ) -> List[FlightRoute]:
         """
         Search flights from/to nearby airports.
 
         Often flights to/from alternative airports are significantly cheaper.
+        Pairs already present in `seen` (e.g. scheduled by an enclosing
+        comprehensive search) are skipped so no pair is simulated twice.
         """
         self.logger.info(f"Searching nearby airport combinations")
 
         nearby_routes = []
-
-        # Get nearby airports
-        origin_airports = [origin] + self.airport_helper.get_nearby_airports(origin)
-        dest_airports = [destination] + self.airport_helper.get_nearby_airports(destination)
-
-        # Try all combinations
-        for orig, dest in itertools.product(origin_airports, dest_airports):
-            if orig == origin and dest == destination:
-                continue  # Skip the original route
-
-            route = self.search_direct_flight(orig, dest, departure_date, return_date)
-            route.route_type = 'nearby_airport'
-            nearby_routes.append(route)
-
-        return sorted(nearby_routes, key=lambda r: r.price)
+        if seen is None:
+            seen = set()
+        seen.add((origin, destination))
+
+        # Get nearby airports, deduplicated while preserving order
+        origin_airports = list(dict.fromkeys([origin] + self.airport_helper.get_nearby_airports(origin)))
+        dest_airports = list(dict.fromkeys([destination] + self.airport_helper.get_nearby_airports(destination)))
+
+        # Try all combinations not already covered. The original pair is
+        # excluded structurally from the inner iterable, so the hot loop
+        # only pays the seen-set check for cross-call dedup.
+        for orig in origin_airports:
+            if orig != origin:
+                inner = dest_airports
+            else:
+                inner = [dest for dest in dest_airports if dest != destination]
+
+            for dest in inner:
+                pair = (orig, dest)
+                if pair in seen:
+                    continue
+                seen.add(pair)
+
+                route = self.search_direct_flight(orig, dest, departure_date, return_date)
+                route.route_type = 'nearby_airport'
+                nearby_routes.append(route)
+
+        return sorted(nearby_routes, key=_PRICE)
 
     def search_multi_leg(
         self,
@@ -200,53 +354,44 @@ class FlightSearchEngine:
 
         multi_leg_routes = []
 
-        # Find potential hub cities
-        hubs = self._get_potential_hubs(origin, destination)
+        # Find potential hub cities, pruned to geographically plausible ones
+        hubs = self._filter_hubs_by_geometry(
+            origin, destination, self._get_potential_hubs(origin, destination)
+        )
 
+        # Price every leg of every hub split in a single batch
+        per_hub = 4 if return_date else 2
+        pairs = []
         for hub in hubs:
-            # Split into two separate bookings
-            leg1_price = self.search_direct_flight(origin, hub, departure_date).price
-            leg2_price = self.search_direct_flight(hub, destination, departure_date).price
+            pairs.append((origin, hub, departure_date))
+            pairs.append((hub, destination, departure_date))
+            if return_date:
+                pairs.append((destination, hub, return_date))
+                pairs.append((hub, origin, return_date))
+        prices = self._calculate_base_prices_batch(pairs)
 
-            total_price = leg1_price + leg2_price
+        for i, hub in enumerate(hubs):
+            leg_prices = prices[i * per_hub:(i + 1) * per_hub]
+            leg1_price, leg2_price = leg_prices[0], leg_prices[1]
+            total_price = sum(leg_prices)
 
+            dep_iso = departure_date.isoformat()
             legs = [
-                {
-                    'origin': origin,
-                    'destination': hub,
-                    'departure': departure_date.isoformat(),
-                    'price': leg1_price,
-                    'booking_type': 'separate'
-                },
-                {
-                    'origin': hub,
-                    'destination': destination,
-                    'departure': departure_date.isoformat(),
-                    'price': leg2_price,
-                    'booking_type': 'separate'
-                }
+                dict(_SPLIT_LEG, origin=origin, destination=hub,
+                     departure=dep_iso, price=leg1_price),
+                dict(_SPLIT_LEG, origin=hub, destination=destination,
+                     departure=dep_iso, price=leg2_price)
             ]
 
             if return_date:
-                leg3_price = self.search_direct_flight(destination, hub, return_date).price
-                leg4_price = self.search_direct_flight(hub, origin, return_date).price
-                total_price += leg3_price + leg4_price
+                leg3_price, leg4_price = leg_prices[2], leg_prices[3]
 
+                ret_iso = return_date.isoformat()
                 legs.extend([
-                    {
-                        'origin': destination,
-                        'destination': hub,
-                        'departure': return_date.isoformat(),
-                        'price': leg3_price,
-                        'booking_type': 'separate'
-                    },
-                    {
-                        'origin': hub,
-                        'destination': origin,
-                        'departure': return_date.isoformat(),
-                        'price': leg4_price,
-                        'booking_type': 'separate'
-                    }
+                    dict(_SPLIT_LEG, origin=destination, destination=hub,
+                         departure=ret_iso, price=leg3_price),
+                    dict(_SPLIT_LEG, origin=hub, destination=origin,
+                         departure=ret_iso, price=leg4_price)
                 ])
 
             route = FlightRoute(
@@ -261,7 +406,7 @@ class FlightSearchEngine:
             )
             multi_leg_routes.append(route)
 
-        return sorted(multi_leg_routes, key=lambda r: r.price)
+        return sorted(multi_leg_routes, key=_PRICE)
 
     def comprehensive_search(
         self,
@@ -278,83 +423,118 @@ class FlightSearchEngine:
         self.logger.info(f"Starting comprehensive search: {origin} → {destination}")
 
         all_routes = []
+        seen: Set[Tuple[str, str]] = set()
 
         # 1. Direct flight
         direct = self.search_direct_flight(origin, destination, departure_date, return_date)
         all_routes.append(direct)
+        seen.add((origin, destination))
+
+        # 2.-4. The remaining strategies are data-independent; fan them out
+        # across worker threads (in production each hits a flight API, so
+        # the speedup is bounded by the slowest strategy, not the sum)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Hidden city reuses the one-way direct price as threshold
+            # (the round-trip price is not comparable to one-way legs)
+            f_hidden = executor.submit(
+                self.search_hidden_city, origin, destination, departure_date,
+                direct_price=None if return_date else direct.price
+            )
+            f_nearby = executor.submit(
+                self.search_nearby_airports, origin, destination,
+                departure_date, return_date, seen=seen
+            )
+            f_multi = executor.submit(
+                self.search_multi_leg, origin, destination,
+                departure_date, return_date
+            )
 
-        # 2. Hidden city opportunities
-        hidden_city_routes = self.search_hidden_city(origin, destination, departure_date)
-        all_routes.extend(hidden_city_routes)
+            all_routes.extend(f_hidden.result())
+            all_routes.extend(f_nearby.result()[:5])  # Top 5 nearby combinations
+            all_routes.extend(f_multi.result()[:3])  # Top 3 multi-leg options
 
-        # 3. Nearby airports
-        nearby_routes = self.search_nearby_airports(origin, destination, departure_date, return_date)
-        all_routes.extend(nearby_routes[:5])  # Top 5 nearby combinations
+        # Sort by price, then analyze and serialize in a single pass
+        all_routes.sort(key=_PRICE)
 
-        # 4. Multi-leg combinations
-        multi_leg_routes = self.search_multi_leg(origin, destination, departure_date, return_date)
-        all_routes.extend(multi_leg_routes[:3])  # Top 3 multi-leg options
+        return self._finalize(all_routes, direct)
 
-        # Sort by price
-        all_routes.sort(key=lambda r: r.price)
+    def _price_only(self, origin: str, destination: str, date: datetime) -> float:
+        """One-way price for a single leg, without building a FlightRoute."""
+        return _cached_base_price(self, origin, destination, date.date().isoformat())
 
-        # Analyze price gaps
-        analysis = self._analyze_price_gaps(all_routes, direct.price)
+    def _calculate_base_prices_batch(self, pairs: List[Tuple[str, str, datetime]]) -> List[float]:
+        """
+        Price a batch of (origin, destination, date) tuples in one call.
 
-        return {
-            'direct_flight': direct.to_dict(),
-            'cheapest_option': all_routes[0].to_dict() if all_routes else None,
-            'all_options': [route.to_dict() for route in all_routes[:10]],
-            'price_analysis': analysis,
-            'total_options_found': len(all_routes)
-        }
+        Batches over the memoized scalar path, so callers that need many
+        prices at once (multi-leg probes) avoid per-route object
+        construction and share cache hits across the batch.
+        """
+        return [
+            _cached_base_price(self, origin, destination, date.date().isoformat())
+            for origin, destination, date in pairs
+        ]
 
     def _calculate_base_price(self, origin: str, destination: str, date: datetime) -> float:
         """Simulate base price calculation."""
         # Simple simulation based on route distance and date
-        import random
-
         base = 150.0
 
         # Adjust for international vs domestic
-        origin_info = self.airport_helper.get_airport_info(origin)
-        dest_info = self.airport_helper.get_airport_info(destination)
+        origin_country = _COUNTRY_BY_CODE.get(origin.upper())
+        dest_country = _COUNTRY_BY_CODE.get(destination.upper())
 
-        if origin_info and dest_info:
-            if origin_info['country'] != dest_info['country']:
-                base *= 2.5  # International multiplier
+        if origin_country and dest_country and origin_country != dest_country:
+            base *= 2.5  # International multiplier
 
-        # Add some randomness
-        base *= random.uniform(0.8, 1.3)
+        # Add some randomness, seeded by route and day so repeated calls
+        # for the same inputs return the same simulated price. A local RNG
+        # keeps concurrent searches from interleaving seed/draw pairs.
+        day_iso = date.date().isoformat()
+        rng = random.Random(hash((origin, destination, day_iso)))
+        base *= rng.uniform(0.8, 1.3)
 
         # Adjust for booking window
-        booking_window = DateHelper.get_optimal_booking_window(date)
-        if booking_window['status'] == 'very_late':
-            base *= 1.5
-        elif booking_window['status'] == 'late':
-            base *= 1.2
+        base *= _WINDOW_MULT.get(_booking_window_status(day_iso), 1.0)
 
         return round(base, 2)
 
-    def _get_cities_beyond(self, destination: str) -> List[str]:
+    def _get_cities_beyond(self, destination: str) -> Tuple[str, ...]:
         """Get cities that could be beyond the destination for hidden city tickets."""
-        # Simplified logic - in production, use geographic data
-        beyond_cities = {
-            'JFK': ['BOS', 'YUL', 'YYZ'],  # Beyond NYC
-            'LHR': ['DUB', 'MAN', 'EDI'],  # Beyond London
-            'CDG': ['AMS', 'BRU', 'LUX'],  # Beyond Paris
-            'FRA': ['MUC', 'VIE', 'ZRH'],  # Beyond Frankfurt
-            'DXB': ['DOH', 'AUH', 'MCT'],  # Beyond Dubai
-        }
-        return beyond_cities.get(destination, [])
+        return _CITIES_BEYOND.get(destination, ())
 
     def _get_potential_hubs(self, origin: str, destination: str) -> List[str]:
         """Get potential hub cities between origin and destination."""
-        # Major European and international hubs
-        hubs = ['FRA', 'AMS', 'CDG', 'LHR', 'MUC', 'IST', 'DXB', 'DOH']
-
         # Filter out origin and destination
-        return [h for h in hubs if h not in [origin, destination]]
+        return [h for h in _HUBS if h != origin and h != destination]
+
+    def _filter_hubs_by_geometry(
+        self,
+        origin: str,
+        destination: str,
+        hubs: List[str]
+    ) -> List[str]:
+        """
+        Keep only hubs whose detour stays near the direct great-circle path.
+
+        A hub far off the origin-destination axis cannot produce a sensible
+        split ticket, so pruning it skips the leg pricing entirely. Airports
+        without coordinate data keep the full candidate list.
+        """
+        origin_coords = _AIRPORT_COORDS.get(origin)
+        dest_coords = _AIRPORT_COORDS.get(destination)
+        if origin_coords is None or dest_coords is None:
+            return hubs
+
+        direct_km = _great_circle_km(origin_coords, dest_coords)
+        max_detour_km = _MAX_DETOUR_FACTOR * direct_km
+
+        return [
+            hub for hub in hubs
+            if (coords := _AIRPORT_COORDS.get(hub)) is not None
+            and _great_circle_km(origin_coords, coords)
+            + _great_circle_km(coords, dest_coords) <= max_detour_km
+        ]
 
     def _simulate_layover_route(
         self,
@@ -367,21 +547,14 @@ class FlightSearchEngine:
         # Check if this routing makes geographic sense
         # In production, verify actual flight availability
 
-        price = self._calculate_base_price(origin, final_dest, date) * 0.85  # Hidden city often cheaper
+        price = _cached_base_price(self, origin, final_dest, date.date().isoformat()) * 0.85  # Hidden city often cheaper
 
+        date_iso = date.isoformat()
         legs = [
-            {
-                'origin': origin,
-                'destination': layover,
-                'departure': date.isoformat(),
-                'layover': True
-            },
-            {
-                'origin': layover,
-                'destination': final_dest,
-                'departure': date.isoformat(),
-                'note': 'You would skip this leg (hidden city)'
-            }
+            dict(_BARE_LEG, origin=origin, destination=layover,
+                 departure=date_iso, layover=True),
+            dict(_BARE_LEG, origin=layover, destination=final_dest,
+                 departure=date_iso, note='You would skip this leg (hidden city)')
         ]
 
         return FlightRoute(
@@ -394,40 +567,84 @@ class FlightSearchEngine:
             route_type='hidden_city'
         )
 
-    def _analyze_price_gaps(self, routes: List[FlightRoute], direct_price: float) -> Dict[str, Any]:
-        """Analyze price gaps between different routing strategies."""
-        if not routes:
-            return {}
+    def _finalize(self, routes: List[FlightRoute], direct: FlightRoute) -> Dict[str, Any]:
+        """
+        Build the comprehensive-search result from the price-ranked routes.
 
-        cheapest = routes[0]
-        savings = calculate_price_difference(cheapest.price, direct_price)
+        One traversal serializes the leading options and accumulates the
+        per-type aggregates for the price-gap analysis, instead of separate
+        passes for grouping, averaging and serialization.
+        """
+        if not routes:
+            return {
+                'direct_flight': direct.to_dict(),
+                'cheapest_option': None,
+                'all_options': [],
+                'price_analysis': {},
+                'total_options_found': 0
+            }
 
-        # Group by route type
-        route_types = {}
+        # Running per-type sums and counts; one pass, no per-type price lists
+        sums: defaultdict = defaultdict(float)
+        counts: defaultdict = defaultdict(int)
+        options = []
         for route in routes:
-            if route.route_type not in route_types:
-                route_types[route.route_type] = []
-            route_types[route.route_type].append(route.price)
-
-        # Calculate average price by type
-        avg_by_type = {
-            rtype: sum(prices) / len(prices)
-            for rtype, prices in route_types.items()
-        }
+            sums[route.route_type] += route.price
+            counts[route.route_type] += 1
+            if len(options) < 10:
+                options.append(route.to_dict())
 
-        return {
+        cheapest = routes[0]
+        direct_price = direct.price
+        # Inline savings arithmetic; only the two magnitudes are needed here
+        savings_amount = abs(direct_price - cheapest.price)
+        savings_percentage = (savings_amount / direct_price * 100) if direct_price > 0 else 0
+
+        analysis = {
             'direct_price': direct_price,
             'cheapest_price': cheapest.price,
-            'savings_amount': abs(savings['absolute']),
-            'savings_percentage': abs(savings['percentage']),
+            'savings_amount': savings_amount,
+            'savings_percentage': savings_percentage,
             'cheapest_route_type': cheapest.route_type,
-            'average_by_route_type': avg_by_type,
+            'average_by_route_type': {rtype: sums[rtype] / counts[rtype] for rtype in sums},
             'price_range': {
-                'min': routes[0].price,
+                'min': cheapest.price,
                 'max': routes[-1].price
             }
         }
 
+        return {
+            'direct_flight': direct.to_dict(),
+            'cheapest_option': cheapest.to_dict(),
+            'all_options': options,
+            'price_analysis': analysis,
+            'total_options_found': len(routes)
+        }
+
+
+# Legality metadata per route type: (score, legal, risk, recommendation).
+# Built once and treated as read-only by callers.
+_ROUTE_META: Dict[str, Tuple[int, bool, str, str]] = {
+    'direct': (
+        10, True, 'None',
+        'Safest option with full airline protection.'
+    ),
+    'nearby_airport': (
+        10, True, 'Ground transportation needed',
+        'Legal and safe. Consider ground transportation time and cost.'
+    ),
+    'multi_leg_split': (
+        7, True, 'No connection protection',
+        'Legal but risky. No protection if first flight delayed. Allow buffer time.'
+    ),
+    'hidden_city': (
+        3, False, 'Violates airline ToS, bags checked through',
+        'NOT RECOMMENDED: Violates ToS, can lead to account suspension. Only check carry-on bags.'
+    ),
+}
+
+_DEFAULT_META = (5, True, 'Unknown', 'Review terms carefully.')
+
 
 def rank_legal_options(routes: List[FlightRoute]) -> List[Dict[str, Any]]:
     """
@@ -438,36 +655,18 @@ def rank_legal_options(routes: List[FlightRoute]) -> List[Dict[str, Any]]:
     """
     ranked = []
 
-    legality_scores = {
-        'direct': {'score': 10, 'legal': True, 'risk': 'None'},
-        'nearby_airport': {'score': 10, 'legal': True, 'risk': 'Ground transportation needed'},
-        'multi_leg_split': {'score': 7, 'legal': True, 'risk': 'No connection protection'},
-        'hidden_city': {'score': 3, 'legal': False, 'risk': 'Violates airline ToS, bags checked through'}
-    }
-
     for route in routes:
-        legality = legality_scores.get(route.route_type, {'score': 5, 'legal': True, 'risk': 'Unknown'})
+        score, legal, risk, recommendation = _ROUTE_META.get(route.route_type, _DEFAULT_META)
 
         ranked.append({
             'route': route.to_dict(),
-            'legality_score': legality['score'],
-            'is_legal': legality['legal'],
-            'risks': legality['risk'],
-            'recommendation': _get_recommendation(route.route_type, legality)
+            'legality_score': score,
+            'is_legal': legal,
+            'risks': risk,
+            'recommendation': recommendation
         })
 
     # Sort by price but keep legality info
     ranked.sort(key=lambda x: x['route']['price'])
 
     return ranked
-
-
-def _get_recommendation(route_type: str, legality: Dict) -> str:
-    """Get recommendation text for route type."""
-    recommendations = {
-        'direct': 'Safest option with full airline protection.',
-        'nearby_airport': 'Legal and safe. Consider ground transportation time and cost.',
-        'multi_leg_split': 'Legal but risky. No protection if first flight delayed. Allow buffer time.',
-        'hidden_city': 'NOT RECOMMENDED: Violates ToS, can lead to account suspension. Only check carry-on bags.'
-    }
-    return recommendations.get(route_type, 'Review terms carefully.')
@@ -3,12 +3,23 @@ Shared utility functions for the flight price analyzer.
 Provides logging, currency conversion, formatting, and helper functions.
 """
 
+import atexit
+import bisect
+import functools
+from collections import OrderedDict
+import heapq
+import itertools
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import json
+import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import hashlib
 import random
+import secrets
+import threading
 import time
 
 
@@ -19,8 +30,8 @@ class FlightLogger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
 
-        # File handler
-        fh = logging.FileHandler(log_file)
+        # File handler; delay=True defers opening the file until needed
+        fh = logging.FileHandler(log_file, delay=True)
         fh.setLevel(logging.DEBUG)
 
         # Console handler
@@ -34,20 +45,35 @@ class FlightLogger:
         fh.setFormatter(formatter)
         ch.setFormatter(formatter)
 
-        self.logger.addHandler(fh)
-        self.logger.addHandler(ch)
+        # Emit through a queue so file and console writes happen on the
+        # listener thread instead of blocking the caller
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(QueueHandler(log_queue))
+        self._listener = QueueListener(log_queue, fh, ch, respect_handler_level=True)
+        self._listener.start()
+        # Drain anything still queued when the interpreter shuts down
+        atexit.register(self._listener.stop)
 
-    def info(self, message: str):
-        self.logger.info(message)
+    def info(self, message: str, *args):
+        self.logger.info(message, *args)
 
-    def debug(self, message: str):
-        self.logger.debug(message)
+    def debug(self, message: str, *args):
+        self.logger.debug(message, *args)
 
-    def warning(self, message: str):
-        self.logger.warning(message)
+    def warning(self, message: str, *args):
+        self.logger.warning(message, *args)
 
-    def error(self, message: str):
-        self.logger.error(message)
+    def error(self, message: str, *args):
+        self.logger.error(message, *args)
+
+
+def _build_pair_factors(rates: Dict[str, float]) -> Dict[tuple, float]:
+    """Precompute (from, to) -> factor so a conversion is one multiply."""
+    return {
+        (from_c, to_c): rates[to_c] / rates[from_c]
+        for from_c in rates
+        for to_c in rates
+    }
 
 
 class CurrencyConverter:
@@ -68,35 +94,59 @@ class CurrencyConverter:
         'THB': 36.50,
     }
 
+    # Every currency pair resolved to a single factor at import time;
+    # unknown currencies fall through to the identity factor, matching
+    # the old "return amount unchanged" behavior
+    _PAIR_FACTORS = _build_pair_factors(RATES)
+
     @classmethod
     def convert(cls, amount: float, from_currency: str, to_currency: str = 'EUR') -> float:
         """Convert amount from one currency to another."""
-        if from_currency not in cls.RATES or to_currency not in cls.RATES:
-            return amount
+        return amount * cls._PAIR_FACTORS.get((from_currency, to_currency), 1.0)
 
-        # Convert to EUR first, then to target currency
-        eur_amount = amount / cls.RATES[from_currency]
-        return eur_amount * cls.RATES[to_currency]
+    @classmethod
+    def convert_many(cls, amounts: List[float], from_currency: str, to_currency: str = 'EUR') -> List[float]:
+        """Convert a batch of amounts with one factor lookup for the lot."""
+        factor = cls._PAIR_FACTORS.get((from_currency, to_currency), 1.0)
+        return [amount * factor for amount in amounts]
+
+    # Display symbols per currency; codes without one fall back to the code
+    _SYMBOLS = {
+        'EUR': '€',
+        'USD': '$',
+        'GBP': '£',
+        'CHF': 'CHF',
+        'CAD': 'CAD',
+        'AUD': 'AUD',
+        'JPY': '¥',
+        'CNY': '¥',
+        'INR': '₹',
+        'AED': 'AED',
+        'THB': '฿',
+    }
 
     @classmethod
     def format_price(cls, amount: float, currency: str = 'EUR') -> str:
         """Format price with currency symbol."""
-        symbols = {
-            'EUR': '€',
-            'USD': '$',
-            'GBP': '£',
-            'CHF': 'CHF',
-            'CAD': 'CAD',
-            'AUD': 'AUD',
-            'JPY': '¥',
-            'CNY': '¥',
-            'INR': '₹',
-            'AED': 'AED',
-            'THB': '฿',
-        }
-        symbol = symbols.get(currency, currency)
+        symbol = cls._SYMBOLS.get(currency, currency)
         return f"{symbol}{amount:.2f}"
 
+    @classmethod
+    def format_prices(cls, amounts: List[float], currency: str = 'EUR') -> List[str]:
+        """Format a batch of prices, resolving the symbol once for the lot."""
+        prefix = cls._SYMBOLS.get(currency, currency)
+        return [f"{prefix}{amount:.2f}" for amount in amounts]
+
+
+def _build_nearby_closure(nearby: Dict[str, List[str]]) -> Dict[str, frozenset]:
+    """Symmetric closure of the nearby relation, as frozensets for O(1) tests."""
+    closure: Dict[str, set] = {}
+    for code, neighbours in nearby.items():
+        closure.setdefault(code, set()).update(neighbours)
+        for neighbour in neighbours:
+            closure.setdefault(neighbour, set()).add(code)
+    return {code: frozenset(members) for code, members in closure.items()}
+
 
 class AirportHelper:
     """Airport and route utilities."""
@@ -138,26 +188,107 @@ class AirportHelper:
         'DXB': ['AUH'],
     }
 
+    # "X is near Y" also means "Y is near X"; the one-directional table
+    # above only lists majors, so membership checks go through this
+    _NEARBY_CLOSURE = _build_nearby_closure(NEARBY_AIRPORTS)
+
+    # IATA codes are exactly three ASCII letters
+    _IATA_RE = re.compile(r'^[A-Z]{3}$')
+
+    @classmethod
+    def normalize(cls, code: str) -> str:
+        """
+        Normalize an airport code to canonical uppercase form.
+
+        Raises ValueError if the result is not a valid IATA code shape,
+        so bad input fails fast before any analysis starts.
+        """
+        normalized = code.strip().upper()
+        if not cls._IATA_RE.match(normalized):
+            raise ValueError(f"Invalid airport code: {code!r}")
+        return normalized
+
     @classmethod
     def get_airport_info(cls, code: str) -> Optional[Dict[str, str]]:
-        """Get airport information."""
-        return cls.AIRPORTS.get(code.upper())
+        """Get airport information. Memoized; the tables never change."""
+        return _airport_info(code)
 
     @classmethod
     def get_nearby_airports(cls, code: str) -> List[str]:
-        """Get list of nearby airports."""
-        return cls.NEARBY_AIRPORTS.get(code.upper(), [])
+        """Get list of nearby airports. Memoized; the tables never change."""
+        return _nearby_airports(code)
 
     @classmethod
-    def format_route(cls, origin: str, destination: str) -> str:
-        """Format route as readable string."""
-        origin_info = cls.get_airport_info(origin)
-        dest_info = cls.get_airport_info(destination)
-
-        origin_name = origin_info['city'] if origin_info else origin
-        dest_name = dest_info['city'] if dest_info else destination
+    def are_nearby(cls, code_a: str, code_b: str) -> bool:
+        """Check whether two airports count as nearby, in either direction."""
+        return code_b.upper() in cls._NEARBY_CLOSURE.get(code_a.upper(), ())
 
-        return f"{origin_name} ({origin}) → {dest_name} ({destination})"
+    @classmethod
+    def format_route(cls, origin: str, destination: str) -> str:
+        """Format route as readable string. Memoized per route pair."""
+        return _format_route(origin, destination)
+
+
+@functools.lru_cache(maxsize=4096)
+def _airport_info(code: str) -> Optional[Dict[str, str]]:
+    """Memoized airport lookup; skips the .upper() pass on repeat codes."""
+    return AirportHelper.AIRPORTS.get(code.upper())
+
+
+@functools.lru_cache(maxsize=512)
+def _nearby_airports(code: str) -> List[str]:
+    """Memoized nearby-airport lookup; callers treat the list as read-only."""
+    return AirportHelper.NEARBY_AIRPORTS.get(code.upper(), [])
+
+
+# Branch-free fallback for unknown codes in route formatting
+_EMPTY_AIRPORT = {'city': None}
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_route(origin: str, destination: str) -> str:
+    """Memoized route string; repeat pairs skip lookups and formatting."""
+    airports = AirportHelper.AIRPORTS
+    origin_name = airports.get(origin.upper(), _EMPTY_AIRPORT)['city'] or origin
+    dest_name = airports.get(destination.upper(), _EMPTY_AIRPORT)['city'] or destination
+    return f"{origin_name} ({origin}) → {dest_name} ({destination})"
+
+
+# Single shared step for date-range generation
+_ONE_DAY = timedelta(days=1)
+
+# Booking-window verdicts, bucketed by days until departure. The keys are
+# the inclusive upper bound of each bucket; departures beyond the last key
+# fall into the final verdict. Preallocated and treated as read-only by
+# callers.
+_BOOKING_WINDOW_KEYS = (7, 21, 90, 180)
+_BOOKING_WINDOWS = (
+    {
+        'status': 'very_late',
+        'recommendation': 'Last minute - expect high prices',
+        'optimal_days_before': [0, 7]
+    },
+    {
+        'status': 'late',
+        'recommendation': 'Book soon, prices may increase',
+        'optimal_days_before': [7, 21]
+    },
+    {
+        'status': 'optimal',
+        'recommendation': 'Optimal booking window',
+        'optimal_days_before': [21, 90]
+    },
+    {
+        'status': 'good',
+        'recommendation': 'Good time to book, prices stable',
+        'optimal_days_before': [60, 90]
+    },
+    {
+        'status': 'too_early',
+        'recommendation': 'Wait until 2-3 months before departure',
+        'optimal_days_before': [60, 90]
+    },
+)
 
 
 class DateHelper:
@@ -166,13 +297,7 @@ class DateHelper:
     @staticmethod
     def parse_date(date_str: str) -> datetime:
         """Parse date string to datetime object."""
-        formats = ['%Y-%m-%d', '%d.%m.%Y', '%d/%m/%Y']
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        raise ValueError(f"Unable to parse date: {date_str}")
+        return _parse_date_cached(date_str)
 
     @staticmethod
     def format_date(date_obj: datetime, format_str: str = '%Y-%m-%d') -> str:
@@ -182,45 +307,67 @@ class DateHelper:
     @staticmethod
     def get_date_range(start_date: datetime, days: int = 7) -> List[datetime]:
         """Get list of dates in range."""
-        return [start_date + timedelta(days=i) for i in range(days)]
+        if days <= 0:
+            return []
+        # Accumulating a shared one-day step does one addition per date,
+        # instead of constructing a fresh timedelta for every offset
+        return list(itertools.accumulate(
+            itertools.repeat(_ONE_DAY, days - 1), initial=start_date
+        ))
 
     @staticmethod
-    def get_optimal_booking_window(departure_date: datetime) -> Dict[str, Any]:
-        """Calculate optimal booking window based on departure date."""
-        today = datetime.now()
+    def get_optimal_booking_window(
+        departure_date: datetime,
+        today: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Calculate optimal booking window based on departure date.
+
+        Bulk callers sweeping many departures pass the same `today` once,
+        skipping a clock read per call. Plain `date` objects work too, as
+        long as both arguments agree.
+        """
+        if today is None:
+            today = datetime.now()
         days_until_departure = (departure_date - today).days
 
-        # General rules for booking windows
-        if days_until_departure > 180:
-            return {
-                'status': 'too_early',
-                'recommendation': 'Wait until 2-3 months before departure',
-                'optimal_days_before': [60, 90]
-            }
-        elif days_until_departure > 90:
-            return {
-                'status': 'good',
-                'recommendation': 'Good time to book, prices stable',
-                'optimal_days_before': [60, 90]
-            }
-        elif days_until_departure > 21:
-            return {
-                'status': 'optimal',
-                'recommendation': 'Optimal booking window',
-                'optimal_days_before': [21, 90]
-            }
-        elif days_until_departure > 7:
-            return {
-                'status': 'late',
-                'recommendation': 'Book soon, prices may increase',
-                'optimal_days_before': [7, 21]
-            }
-        else:
-            return {
-                'status': 'very_late',
-                'recommendation': 'Last minute - expect high prices',
-                'optimal_days_before': [0, 7]
-            }
+        # Bucket lookup over the preallocated verdicts; no per-call dict
+        # construction and no branch cascade
+        idx = bisect.bisect_left(_BOOKING_WINDOW_KEYS, days_until_departure)
+        return _BOOKING_WINDOWS[idx]
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date_cached(date_str: str) -> datetime:
+    """
+    Parse a date string, dispatching on its shape.
+
+    The separator position picks the right strptime format directly, so
+    the happy path runs strptime exactly once instead of walking a
+    trial-and-except format list. Memoized because booking-date strings
+    repeat heavily across analyses.
+    """
+    # Fast path for the dominant zero-padded ISO form: three int() calls
+    # beat strptime's regex and format-string machinery by a wide margin
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+        except ValueError:
+            raise ValueError(f"Unable to parse date: {date_str}") from None
+
+    if len(date_str) > 4 and date_str[4] == '-':
+        fmt = '%Y-%m-%d'
+    elif len(date_str) > 2 and date_str[2] == '.':
+        fmt = '%d.%m.%Y'
+    elif len(date_str) > 2 and date_str[2] == '/':
+        fmt = '%d/%m/%Y'
+    else:
+        raise ValueError(f"Unable to parse date: {date_str}")
+
+    try:
+        return datetime.strptime(date_str, fmt)
+    except ValueError:
+        raise ValueError(f"Unable to parse date: {date_str}") from None
 
 
 class RequestHelper:
@@ -234,22 +381,26 @@ class RequestHelper:
         'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     ]
 
+    # Dedicated PRNG; skips the shared module-level instance's locking
+    # and global-state indirection on per-request draws
+    _rng = random.Random()
+
     @classmethod
     def get_random_user_agent(cls) -> str:
         """Get random user agent string."""
-        return random.choice(cls.USER_AGENTS)
+        return cls._rng.choice(cls.USER_AGENTS)
 
     @staticmethod
     def generate_session_id() -> str:
         """Generate unique session ID."""
-        timestamp = str(time.time())
-        random_str = str(random.random())
-        return hashlib.md5(f"{timestamp}{random_str}".encode()).hexdigest()
+        # os.urandom-backed, so no hashing round-trip and better entropy
+        # than the timestamp+PRNG digest it replaces; same 32-char shape
+        return secrets.token_hex(16)
 
-    @staticmethod
-    def calculate_delay(base_delay: float = 2.0, jitter: float = 1.0) -> float:
+    @classmethod
+    def calculate_delay(cls, base_delay: float = 2.0, jitter: float = 1.0) -> float:
         """Calculate random delay to avoid detection."""
-        return base_delay + random.uniform(0, jitter)
+        return base_delay + cls._rng.uniform(0, jitter)
 
     @classmethod
     def get_safe_headers(cls, referer: Optional[str] = None) -> Dict[str, str]:
@@ -271,41 +422,75 @@ class RequestHelper:
 class DataCache:
     """Simple in-memory cache for API responses."""
 
-    def __init__(self, ttl: int = 3600):
-        self.cache = {}
+    def __init__(self, ttl: int = 3600, maxsize: int = 10000):
+        # Ordered oldest-used first so LRU eviction is a popitem at the front
+        self.cache: 'OrderedDict[str, tuple]' = OrderedDict()
         self.ttl = ttl  # Time to live in seconds
+        self.maxsize = maxsize  # Bound on live entries; oldest-used evicted
+        # Min-heap of (expires_at, key); expired entries for any key are
+        # evicted incrementally on get/set instead of lingering forever
+        self._expiry_heap: List[tuple] = []
+        self._lock = threading.Lock()
+
+    def _evict_expired(self, now: float):
+        """Pop due heap entries, dropping cache entries that really expired."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            _, key = heapq.heappop(heap)
+            entry = self.cache.get(key)
+            # A re-set key has a fresher timestamp than its old heap entry
+            if entry is not None and now - entry[1] >= self.ttl:
+                del self.cache[key]
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
-        if key in self.cache:
-            data, timestamp = self.cache[key]
-            if time.time() - timestamp < self.ttl:
-                return data
-            else:
+        now = time.time()
+        with self._lock:
+            self._evict_expired(now)
+            entry = self.cache.get(key)
+            if entry is not None:
+                data, timestamp = entry
+                if now - timestamp < self.ttl:
+                    self.cache.move_to_end(key)
+                    return data
                 del self.cache[key]
         return None
 
     def set(self, key: str, value: Any):
         """Set value in cache."""
-        self.cache[key] = (value, time.time())
+        now = time.time()
+        with self._lock:
+            self._evict_expired(now)
+            self.cache[key] = (value, now)
+            self.cache.move_to_end(key)
+            heapq.heappush(self._expiry_heap, (now + self.ttl, key))
+            if len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
 
     def clear(self):
         """Clear all cache."""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
+            self._expiry_heap.clear()
 
     def generate_key(self, *args) -> str:
         """Generate cache key from arguments."""
         key_str = '_'.join(str(arg) for arg in args)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        # blake2b outruns md5 in software and keeps the 32-char hex shape
+        return hashlib.blake2b(key_str.encode(), digest_size=16).hexdigest()
 
 
 def format_duration(minutes: int) -> str:
     """Format flight duration."""
-    hours = minutes // 60
-    mins = minutes % 60
+    hours, mins = divmod(minutes, 60)
     return f"{hours}h {mins}m"
 
 
+def format_durations(minutes_list: List[int]) -> List[str]:
+    """Format a batch of flight durations in one pass."""
+    return [f"{m // 60}h {m % 60}m" for m in minutes_list]
+
+
 def calculate_price_difference(price1: float, price2: float) -> Dict[str, Any]:
     """Calculate price difference and percentage."""
     diff = price1 - price2